@@ -27,13 +27,318 @@ Field Mapping Summary:
         - Tracks which pages each net appears on
 """
 
+import hashlib
 import json
+import logging
 import os
+import pickle
 import re
-from typing import List, Dict, Any, Set, Optional
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Set, Optional, Tuple, Union
 from ..interfaces import SchematicProvider
 from ..models import Component, Pin, Net
 
+# Prefer orjson (C + SIMD implementation) for parsing large Altium exports.
+# It is a drop-in replacement for json.loads and is typically several times
+# faster on multi-MB design files. Fall back to the stdlib when unavailable.
+try:
+    import orjson as _json
+    _JSONDecodeError = _json.JSONDecodeError
+except ImportError:
+    _json = json
+    _JSONDecodeError = json.JSONDecodeError
+
+# pysimdjson offers an on-demand parsing mode: Parser.parse() builds only a
+# structural index over the document and returns lazy dict/list proxies, so
+# only the fields actually read (designator, pins[*].net, ...) are ever
+# materialized as Python objects. This cuts peak memory and parse time
+# substantially on multi-MB exports. Optional; the eager path is used when
+# it is not installed.
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# xxhash (xxh3) hashes the raw export at ~memory bandwidth; blake2b from the
+# stdlib is the fallback. Either way hashing is orders of magnitude cheaper
+# than re-tokenizing the JSON, so cache keys are effectively free.
+try:
+    import xxhash
+
+    def _content_key(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    def _content_key(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+# ijson enables incremental parsing for fetch_raw_data_streaming: components
+# stream through one at a time without the full JSON tree ever being held in
+# memory. Optional; only the streaming entry point needs it.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# pandas moves the net-name groupby into vectorized C for large designs.
+# Optional so schematic_core stays usable standalone without it.
+try:
+    import pandas as _pd
+except ImportError:
+    _pd = None
+
+# Minimum flattened pin count before the pandas groupby path pays for the
+# DataFrame construction overhead
+_PANDAS_NET_THRESHOLD = 10000
+
+# Minimum component count before fanning get_components out to a process
+# pool; below this the pool startup and pickling overhead dominates
+_PARALLEL_COMPONENT_THRESHOLD = 500
+
+# Parsed-design cache directory (content-addressed, safe to delete anytime)
+_CACHE_DIR = Path.home() / ".cache" / "kicad_mcp"
+
+# Single-letter pin designators that are simple, not semantic (per spec:
+# diode/LED anode and cathode)
+_SIMPLE_PIN_NAMES = frozenset(("A", "K"))
+
+# Parameter keys mapped onto dedicated Component attributes (value/mpn) and
+# therefore excluded from the free-form properties dict
+_MAPPED_PARAM_KEYS = frozenset(("PN", "Comment"))
+
+# Matches the trailing path segment after the last forward or backslash.
+# Altium exports carry Windows paths, which os.path.basename only splits
+# correctly when running on Windows; the regex is separator-agnostic.
+_BASENAME_RE = re.compile(r'[^\\/]*$')
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _extract_filename(full_path: str) -> str:
+    """
+    Extract filename from full Windows or Unix path.
+
+    Handles both forward slashes and backslashes. Returns just the filename
+    with extension, stripping all directory components.
+
+    Called once per component, but designs have only a handful of distinct
+    sheet paths, so results are memoized.
+
+    Args:
+        full_path: Full path like "C:\\Users\\geoff\\project\\Main.SchDoc"
+
+    Returns:
+        Filename only, e.g., "Main.SchDoc"
+
+    Examples:
+        >>> _extract_filename("C:\\Users\\project\\Main.SchDoc")
+        "Main.SchDoc"
+        >>> _extract_filename("/home/user/project/Main.SchDoc")
+        "Main.SchDoc"
+        >>> _extract_filename("Main.SchDoc")
+        "Main.SchDoc"
+    """
+    if not full_path:
+        return ""
+
+    # os.path.basename only understands the host platform's separator, which
+    # mangles the Windows-style paths Altium emits when running on POSIX;
+    # the precompiled regex handles both separators everywhere (and skips
+    # basename's extra normalization work)
+    return _BASENAME_RE.search(full_path).group(0)
+
+
+@lru_cache(maxsize=None)
+def _is_semantic_pin_name(pin_name: str) -> bool:
+    """
+    Determine if a pin name is semantic (meaningful) vs purely numeric.
+
+    Semantic pin names include things like:
+        - "VCC", "GND", "VOUT", "VIN"
+        - "TX", "RX", "SDA", "SCL"
+        - "S", "G", "D" (for transistors)
+        - "A", "K" (for diodes/LEDs) - BUT spec says these are simple
+        - "Shell" (for connectors)
+
+    Non-semantic (simple) pin names:
+        - Pure numbers: "1", "2", "22", "100"
+        - Single letters that are standard simple: "A", "K"
+        - Empty string
+
+    Pin names repeat massively across components ("1".."100", "VCC", ...),
+    so the classification is memoized; repeat calls cost one dict lookup.
+
+    Args:
+        pin_name: Pin name/designator string
+
+    Returns:
+        True if pin name is semantic and should be included in Pin.name,
+        False if it's just a numeric/simple designator
+
+    Examples:
+        >>> _is_semantic_pin_name("1")
+        False
+        >>> _is_semantic_pin_name("VCC")
+        True
+        >>> _is_semantic_pin_name("A")
+        False  # Standard simple anode/cathode
+    """
+    if not pin_name:
+        return False
+
+    # Pure numeric strings are not semantic
+    if pin_name.isdigit():
+        return False
+
+    # Single-letter simple pin designators (per spec: "A", "K")
+    if pin_name in _SIMPLE_PIN_NAMES:
+        return False
+
+    # Everything else is considered semantic
+    # This includes:
+    #   - Multi-character names: "VCC", "GND", "TX", "RX", "SDA", "SCL"
+    #   - Single semantic letters: "S", "G", "D" (transistor pins)
+    #   - Special names: "Shell", "NC", etc.
+    return True
+
+
+def _transform_pins(pins_data: List[Dict[str, Any]]) -> List[Pin]:
+    """
+    Transform Altium pin data to unified Pin objects.
+
+    Handles both numeric pin designators ("1", "2") and semantic pin names
+    ("VCC", "TX", "S", "G", "D").
+
+    Module-level (rather than a method) so it stays picklable for the
+    multiprocessing path in get_components.
+
+    Args:
+        pins_data: List of pin dictionaries from Altium JSON
+
+    Returns:
+        List of Pin objects
+    """
+    # Preallocate: the pin count is known up front, so indexed stores avoid
+    # the append dispatch and geometric list regrowth
+    pins: List[Pin] = [None] * len(pins_data)  # type: ignore[list-item]
+    for i, pin_data in enumerate(pins_data):
+        # Interned: pin numbers and net names repeat across nearly
+        # every component in the design
+        pin_designator = sys.intern(pin_data.get("name", ""))
+
+        # Handle empty net name (no-connect)
+        net_name = sys.intern(pin_data.get("net", "") or "NC")
+
+        # Determine if pin name is semantic or just numeric (inlined
+        # _is_semantic_pin_name: this is the hottest per-pin check)
+        pin_name = pin_designator if (
+            pin_designator
+            and not pin_designator.isdigit()
+            and pin_designator not in _SIMPLE_PIN_NAMES
+        ) else ""
+
+        pins[i] = Pin(
+            designator=pin_designator,
+            name=pin_name,
+            net=net_name
+        )
+
+    return pins
+
+
+def _transform_component(comp_data: Dict[str, Any]) -> Component:
+    """
+    Transform a single Altium component dict to unified Component model.
+
+    Module-level (rather than a method) so it stays picklable for the
+    multiprocessing path in get_components.
+
+    Args:
+        comp_data: Dictionary containing Altium component data
+
+    Returns:
+        Component object with all fields populated
+
+    Raises:
+        ValueError: If required field 'designator' is missing
+    """
+    # Required field
+    refdes = comp_data.get("designator", "")
+    if not refdes:
+        raise ValueError("Component missing required 'designator' field")
+    # Interned alongside pin designators and net names: refdes strings are
+    # re-keyed constantly in net members and downstream indexes, and
+    # interning makes those dict probes pointer-equal
+    refdes = sys.intern(refdes)
+
+    # Extract parameters dict
+    parameters = comp_data.get("parameters", {})
+
+    # Map fields with fallbacks. The value falls back Comment -> PN ->
+    # empty; fetching PN once serves both mpn and the fallback chain.
+    mpn = parameters.get("PN", "")
+    value = parameters.get("Comment") or mpn or ""
+    footprint = comp_data.get("footprint", "")
+    sheet = comp_data.get("sheet", "")
+    # A design has a handful of distinct pages shared by every component
+    page = sys.intern(_extract_filename(sheet))
+    description = comp_data.get("description", "")
+
+    # Extract location (x, y)
+    x = comp_data.get("schematic_x", 0)
+    y = comp_data.get("schematic_y", 0)
+    location = (x, y)
+
+    # Transform pins
+    pins = _transform_pins(comp_data.get("pins", []))
+
+    # Build properties dict from parameters (exclude fields we've already mapped)
+    properties = {
+        key: str(value_str)
+        for key, value_str in parameters.items()
+        if key not in _MAPPED_PARAM_KEYS
+    }
+
+    return Component(
+        refdes=refdes,
+        value=value,
+        footprint=footprint,
+        mpn=mpn,
+        page=page,
+        description=description,
+        pins=pins,
+        location=location,
+        properties=properties,
+        multipart_parent=None  # Altium sample data doesn't show multi-part
+    )
+
+
+def _safe_transform_component(comp_data: Dict[str, Any]) -> Optional[Component]:
+    """
+    Worker-side wrapper: transform one component, returning None on failure.
+
+    Used by the process-pool path, where exceptions must not abort the whole
+    map. The warning is logged in the worker process.
+
+    Args:
+        comp_data: Dictionary containing Altium component data
+
+    Returns:
+        Component object, or None if transformation failed
+    """
+    try:
+        return _transform_component(comp_data)
+    except Exception as e:
+        logger.warning(
+            "Failed to transform component %s: %s",
+            comp_data.get("designator", "UNKNOWN"), e
+        )
+        return None
+
 
 class AltiumJSONAdapter(SchematicProvider):
     """
@@ -80,19 +385,61 @@ class AltiumJSONAdapter(SchematicProvider):
         }
     """
 
-    def __init__(self, json_data: str):
+    def __init__(self, json_data: Union[str, bytes], cache: bool = True):
         """
         Initialize the adapter with JSON data.
 
         Args:
-            json_data: JSON string containing Altium schematic data
+            json_data: JSON string or UTF-8 bytes containing Altium schematic
+                data. Passing bytes (e.g. from a file opened in binary mode)
+                avoids a redundant decode step when orjson is available.
+            cache: If True, memoize the parsed design on disk keyed by a
+                content hash of the raw JSON, so unchanged designs skip the
+                parse entirely on subsequent runs. Only used by the eager
+                parsing path; the simdjson lazy path never touches the cache.
 
         Raises:
             ValueError: If JSON is malformed or missing required structure
         """
-        self._raw_json = json_data
+        self._raw_json: Union[str, bytes] = json_data
+        self._cache: bool = cache
         self._parsed_data: Optional[Dict[str, Any]] = None
-        self._ready = False
+        # Kept alive while _parsed_data holds simdjson proxies: the parser
+        # owns the underlying structural tape.
+        self._parser: Optional[Any] = None
+        # Schema-specialized transformer generated after parsing (see
+        # _compile_fast_transform); None until then or if codegen was skipped
+        self._fast_transform: Optional[Any] = None
+        # Prebuilt results populated by the streaming path; when set,
+        # get_components/get_nets return them directly
+        self._components_cache: Optional[List[Component]] = None
+        self._nets_cache: Optional[List[Net]] = None
+        # (designator, exception) pairs for components that failed to
+        # transform, for programmatic access alongside the logged warnings
+        self.transform_errors: List[tuple] = []
+        # Set by from_dict(): an already-parsed design that fetch_raw_data
+        # should use as-is instead of parsing _raw_json
+        self._preparsed: Optional[Dict[str, Any]] = None
+        self._ready: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AltiumJSONAdapter":
+        """
+        Build an adapter from an already-parsed design dictionary.
+
+        Skips the JSON serialize/parse round-trip entirely, for callers
+        whose data is already structured (tests, in-process producers).
+        fetch_raw_data() still performs the usual validation.
+
+        Args:
+            data: Design dictionary in the same shape as the JSON export
+
+        Returns:
+            Adapter instance ready for fetch_raw_data()
+        """
+        adapter = cls("{}", cache=False)
+        adapter._preparsed = data
+        return adapter
 
     def fetch_raw_data(self) -> None:
         """
@@ -107,24 +454,253 @@ class AltiumJSONAdapter(SchematicProvider):
             ValueError: If JSON is malformed or missing required fields
             json.JSONDecodeError: If JSON cannot be parsed
         """
+        # Idempotency: drop results from any previous fetch
+        self._components_cache = None
+        self._nets_cache = None
+        self.transform_errors = []
+
+        if self._preparsed is not None:
+            # Already-structured input from from_dict(): nothing to parse
+            self._parsed_data = self._preparsed
+        elif simdjson is not None:
+            # Lazy path: the structural tape is validated up front, but
+            # individual values materialize only when accessed downstream.
+            self._parser = simdjson.Parser()
+            try:
+                self._parsed_data = self._parser.parse(self._raw_json)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON format: {e}")
+        else:
+            cached = None
+            cache_path = None
+            if self._cache:
+                raw = self._raw_json
+                key = _content_key(raw if isinstance(raw, bytes) else raw.encode("utf-8"))
+                cache_path = _CACHE_DIR / f"altium_{key}.pkl"
+                cached = self._load_cached_parse(cache_path)
+
+            if cached is not None:
+                self._parsed_data = cached
+            else:
+                try:
+                    self._parsed_data = _json.loads(self._raw_json)
+                except _JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON format: {e}")
+                if cache_path is not None:
+                    self._store_cached_parse(cache_path, self._parsed_data)
+
+        # Validate required structure. Indexing (rather than an isinstance
+        # check) keeps the lazy proxies from materializing the whole tree.
         try:
-            self._parsed_data = json.loads(self._raw_json)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON format: {e}")
-
-        # Validate required structure
-        if not isinstance(self._parsed_data, dict):
+            components = self._parsed_data["components"]
+        except TypeError:
             raise ValueError("JSON root must be an object/dictionary")
-
-        if "components" not in self._parsed_data:
+        except KeyError:
             # If no components key, assume empty design
-            self._parsed_data["components"] = []
-
-        if not isinstance(self._parsed_data["components"], list):
+            if isinstance(self._parsed_data, dict):
+                self._parsed_data["components"] = []
+            else:
+                self._parsed_data = {"components": []}
+            components = self._parsed_data["components"]
+
+        list_types = (list,) if simdjson is None else (list, simdjson.Array)
+        if not isinstance(components, list_types):
             raise ValueError("'components' must be an array")
 
+        # Every component in one export shares the same schema, so specialize
+        # the transformer for it once instead of re-deciding field mappings
+        # per component
+        self._fast_transform = None
+        self._compile_fast_transform(components)
+
+        self._ready = True
+
+    def fetch_raw_data_streaming(self, source: Union[str, Path, Any]) -> None:
+        """
+        Stream-parse an Altium export without materializing the full tree.
+
+        Components are parsed one at a time via ijson and transformed in the
+        same pass that builds net connectivity, so peak memory is bounded by
+        a single component plus the accumulated results instead of the whole
+        parsed design. Intended for very large exports that would not fit in
+        RAM through fetch_raw_data(). After this call, get_components() and
+        get_nets() return the prebuilt results in O(1).
+
+        Args:
+            source: Path to the JSON file, or a binary file-like object
+
+        Raises:
+            ImportError: If the optional ijson dependency is not installed
+            ValueError: If the JSON is malformed
+        """
+        if ijson is None:
+            raise ImportError(
+                "ijson is required for fetch_raw_data_streaming(); "
+                "install ijson or use fetch_raw_data()"
+            )
+
+        fh = source
+        close_fh = False
+        if isinstance(source, (str, Path)):
+            fh = open(source, "rb")
+            close_fh = True
+
+        components: List[Component] = []
+        nets_dict: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"pages": set(), "members": []}
+        )
+        try:
+            for comp_data in ijson.items(fh, "components.item"):
+                component = self._safe_transform(comp_data)
+                if component is None:
+                    continue
+                components.append(component)
+
+                # Build net connectivity in the same pass; Pin.net is
+                # already normalized ("" -> "NC") by _transform_pins
+                designator = component.refdes
+                page_name = component.page
+                for pin in component.pins:
+                    entry = nets_dict[pin.net]
+                    entry["members"].append((designator, pin.designator))
+                    entry["pages"].add(page_name)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON format: {e}")
+        finally:
+            if close_fh:
+                fh.close()
+
+        self._components_cache = components
+        self._nets_cache = [
+            Net(
+                name=net_name,
+                pages=net_data["pages"],
+                members=net_data["members"]
+            )
+            for net_name, net_data in nets_dict.items()
+        ]
+        self._parsed_data = {"components": []}
         self._ready = True
 
+    def _compile_fast_transform(self, components: Any) -> None:
+        """
+        Generate a transformer specialized to this export's schema.
+
+        All components in a single Altium export carry the same set of keys,
+        so the generic _transform_component re-decides the same field
+        mappings on every call. This inspects the first component and emits
+        (via exec) a function that uses direct indexing for the keys known to
+        be present and dict.get fallbacks for the rest — semantically
+        identical to the generic path, minus the per-call dispatch. If a
+        later component deviates from the schema (KeyError), _safe_transform
+        falls back to the generic path for that component.
+
+        Args:
+            components: Parsed component list (may be a lazy proxy)
+        """
+        try:
+            first = components[0]
+            keys = set(first.keys())
+        except (IndexError, AttributeError, TypeError):
+            return
+
+        if "designator" not in keys:
+            return
+
+        def fetch(key: str, default: str) -> str:
+            # Direct indexing when the schema says the key exists, .get
+            # with the generic default otherwise
+            if key in keys:
+                return f"c[{key!r}]"
+            return f"c.get({key!r}, {default})"
+
+        empty_str = "''"
+        src = "\n".join([
+            "def _fast_transform(c):",
+            "    refdes = c['designator']",
+            "    if not refdes:",
+            "        raise ValueError(\"Component missing required 'designator' field\")",
+            "    refdes = _intern(refdes)",
+            f"    parameters = {fetch('parameters', '_EMPTY_DICT')}",
+            "    mpn = parameters.get('PN', '')",
+            "    value = parameters.get('Comment') or mpn or ''",
+            f"    footprint = {fetch('footprint', empty_str)}",
+            f"    page = _intern(_extract_filename({fetch('sheet', empty_str)}))",
+            f"    description = {fetch('description', empty_str)}",
+            f"    location = ({fetch('schematic_x', '0')}, {fetch('schematic_y', '0')})",
+            f"    pins = _transform_pins({fetch('pins', '_EMPTY_LIST')})",
+            "    properties = {",
+            "        key: str(value_str)",
+            "        for key, value_str in parameters.items()",
+            "        if key not in _MAPPED_PARAM_KEYS",
+            "    }",
+            "    return Component(",
+            "        refdes=refdes,",
+            "        value=value,",
+            "        footprint=footprint,",
+            "        mpn=mpn,",
+            "        page=page,",
+            "        description=description,",
+            "        pins=pins,",
+            "        location=location,",
+            "        properties=properties,",
+            "        multipart_parent=None,",
+            "    )",
+        ])
+
+        namespace = {
+            "_intern": sys.intern,
+            "_EMPTY_DICT": {},
+            "_EMPTY_LIST": [],
+            "_extract_filename": _extract_filename,
+            "_transform_pins": _transform_pins,
+            "_MAPPED_PARAM_KEYS": _MAPPED_PARAM_KEYS,
+            "Component": Component,
+        }
+        exec(src, namespace)  # noqa: S102 - source is built from literals above
+        self._fast_transform = namespace["_fast_transform"]
+
+    @staticmethod
+    def _load_cached_parse(cache_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load a previously parsed design from the content-addressed cache.
+
+        Args:
+            cache_path: Cache file location for this design's content hash
+
+        Returns:
+            The cached parsed dict, or None on miss or unreadable entry
+        """
+        try:
+            with open(cache_path, "rb") as fh:
+                return pickle.load(fh)
+        except Exception:
+            # Any unreadable or corrupted entry (truncated file, garbage
+            # bytes, stale class references...) is just a cache miss;
+            # pickle.load can raise ValueError, AttributeError,
+            # ImportError and IndexError besides UnpicklingError
+            return None
+
+    @staticmethod
+    def _store_cached_parse(cache_path: Path, parsed_data: Dict[str, Any]) -> None:
+        """
+        Store the parsed design in the cache; failures are non-fatal.
+
+        Args:
+            cache_path: Cache file location for this design's content hash
+            parsed_data: Fully parsed design dict to pickle
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a sibling temp file and rename into place so a
+            # killed process can never leave a truncated entry behind
+            tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+            with open(tmp_path, "wb") as fh:
+                pickle.dump(parsed_data, fh, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
     def get_components(self) -> List[Component]:
         """
         Transform Altium component data into unified Component objects.
@@ -143,287 +719,292 @@ class AltiumJSONAdapter(SchematicProvider):
         if not self._ready or self._parsed_data is None:
             raise RuntimeError("Must call fetch_raw_data() before get_components()")
 
-        components = []
-        for comp_data in self._parsed_data["components"]:
-            try:
-                component = self._transform_component(comp_data)
-                components.append(component)
-            except Exception as e:
-                # Log warning but continue processing other components
-                print(f"Warning: Failed to transform component "
-                      f"{comp_data.get('designator', 'UNKNOWN')}: {e}")
-                continue
+        return self.build_all()[0]
 
-        return components
-
-    def get_nets(self) -> List[Net]:
+    def build_all(self) -> "tuple[List[Component], List[Net]]":
         """
-        Build Net objects from component pin connectivity.
-
-        Analyzes all component pins to construct the net list. Each net
-        aggregates all pins connected to it and tracks which pages it appears on.
+        Build components and nets in a single fused pass over the design.
 
-        The Altium JSON does NOT provide complete net-to-pages mappings directly.
-        Instead, we must build nets by examining component pin connectivity.
+        get_components and get_nets used to traverse the parsed structure
+        independently, doubling the memory traffic for the common flow that
+        needs both. This walks the component list once, deriving net
+        connectivity from the freshly transformed pins (already normalized
+        and interned by _transform_pins), and caches both results; repeat
+        calls — and the thin get_components/get_nets wrappers — return the
+        cached lists.
 
         Returns:
-            List of Net objects representing all nets in the design.
-            Returns empty list if no nets exist.
+            Tuple of (components, nets) for the whole design
 
         Raises:
             RuntimeError: If called before fetch_raw_data()
         """
         if not self._ready or self._parsed_data is None:
-            raise RuntimeError("Must call fetch_raw_data() before get_nets()")
-
-        # Build nets from component pin connectivity
-        nets_dict: Dict[str, Dict[str, Any]] = {}
+            raise RuntimeError("Must call fetch_raw_data() before build_all()")
+
+        if self._components_cache is not None and self._nets_cache is not None:
+            return self._components_cache, self._nets_cache
+
+        components = self._transform_components()
+
+        # Flatten connectivity columns straight off the transformed
+        # components; this shares the page/net strings already computed for
+        # the Component objects instead of re-deriving them from raw dicts
+        net_names: List[str] = []
+        comp_designators: List[str] = []
+        pin_designators: List[str] = []
+        page_names: List[str] = []
+        for component in components:
+            designator = component.refdes
+            page_name = component.page
+            for pin in component.pins:
+                net_names.append(pin.net)
+                comp_designators.append(designator)
+                pin_designators.append(pin.designator)
+                page_names.append(page_name)
+
+        nets = self._build_nets_from_columns(
+            net_names, comp_designators, pin_designators, page_names
+        )
 
-        for comp_data in self._parsed_data["components"]:
-            designator = comp_data.get("designator", "")
-            sheet = comp_data.get("sheet", "")
-            page_name = self._extract_filename(sheet)
+        self._components_cache = components
+        self._nets_cache = nets
+        return components, nets
 
-            pins = comp_data.get("pins", [])
-            for pin_data in pins:
-                net_name = pin_data.get("net", "")
+    def _transform_components(self) -> List[Component]:
+        """
+        Transform all parsed component dicts into Component objects.
 
-                # Handle empty net name (no-connect)
-                if not net_name:
-                    net_name = "NC"
+        Returns:
+            List of Component objects; malformed components are skipped
+        """
+        comps = self._parsed_data["components"]
+
+        # Component transformation is embarrassingly parallel: fan out to a
+        # process pool for large designs. Only worth it past the pool
+        # startup/pickling overhead, and only possible on the eager path
+        # (simdjson proxies are not picklable).
+        if (
+            len(comps) >= _PARALLEL_COMPONENT_THRESHOLD
+            and isinstance(comps, list)
+            and isinstance(comps[0], dict)
+        ):
+            with ProcessPoolExecutor() as executor:
+                return [
+                    component
+                    for component in executor.map(
+                        _safe_transform_component, comps, chunksize=256
+                    )
+                    if component is not None
+                ]
+
+        # List comprehension over a failure-swallowing helper: the common
+        # all-good case runs without per-iteration try/except setup or
+        # repeated list.append dispatch.
+        return [
+            component
+            for component in map(self._safe_transform, comps)
+            if component is not None
+        ]
+
+    def _safe_transform(self, comp_data: Dict[str, Any]) -> Optional[Component]:
+        """
+        Transform one component, returning None instead of raising.
 
-                # Initialize net entry if not seen before
-                if net_name not in nets_dict:
-                    nets_dict[net_name] = {
-                        "name": net_name,
-                        "pages": set(),
-                        "members": []
-                    }
+        Failures are logged and recorded in transform_errors so a single
+        malformed component doesn't abort extraction of the rest of the
+        design.
 
-                # Add this pin to the net
-                pin_designator = pin_data.get("name", "")
-                nets_dict[net_name]["members"].append((designator, pin_designator))
-                nets_dict[net_name]["pages"].add(page_name)
+        Args:
+            comp_data: Dictionary containing Altium component data
 
-        # Convert dict to Net objects
-        nets = []
-        for net_data in nets_dict.values():
-            net = Net(
-                name=net_data["name"],
-                pages=net_data["pages"],
-                members=net_data["members"]
+        Returns:
+            Component object, or None if transformation failed
+        """
+        fast = self._fast_transform
+        if fast is not None:
+            try:
+                return fast(comp_data)
+            except Exception:
+                # Component deviates from the specialized schema (or is
+                # malformed); retry through the generic path so the warning
+                # below reports the real failure
+                pass
+        try:
+            return self._transform_component(comp_data)
+        except Exception as e:
+            # Lazy %s formatting: no string work (or I/O) unless warnings
+            # are actually emitted, which matters when a pathological input
+            # fails for thousands of components in a row
+            logger.warning(
+                "Failed to transform component %s: %s",
+                comp_data.get("designator", "UNKNOWN"), e
             )
-            nets.append(net)
-
-        return nets
+            self.transform_errors.append(
+                (comp_data.get("designator", "UNKNOWN"), e)
+            )
+            return None
 
-    def _transform_component(self, comp_data: Dict[str, Any]) -> Component:
+    def get_nets(self) -> List[Net]:
         """
-        Transform a single Altium component dict to unified Component model.
+        Build Net objects from component pin connectivity.
 
-        Args:
-            comp_data: Dictionary containing Altium component data
+        Analyzes all component pins to construct the net list. Each net
+        aggregates all pins connected to it and tracks which pages it appears on.
+
+        The Altium JSON does NOT provide complete net-to-pages mappings directly.
+        Instead, we must build nets by examining component pin connectivity.
 
         Returns:
-            Component object with all fields populated
+            List of Net objects representing all nets in the design.
+            Returns empty list if no nets exist.
 
         Raises:
-            ValueError: If required field 'designator' is missing
-        """
-        # Required field
-        refdes = comp_data.get("designator", "")
-        if not refdes:
-            raise ValueError("Component missing required 'designator' field")
-
-        # Extract parameters dict
-        parameters = comp_data.get("parameters", {})
-
-        # Map fields with fallbacks
-        value = self._get_component_value(comp_data)
-        footprint = comp_data.get("footprint", "")
-        mpn = parameters.get("PN", "")
-        sheet = comp_data.get("sheet", "")
-        page = self._extract_filename(sheet)
-        description = comp_data.get("description", "")
-
-        # Extract location (x, y)
-        x = comp_data.get("schematic_x", 0)
-        y = comp_data.get("schematic_y", 0)
-        location = (x, y)
-
-        # Transform pins
-        pins = self._transform_pins(comp_data.get("pins", []))
-
-        # Build properties dict from parameters (exclude fields we've already mapped)
-        properties = {}
-        for key, value_str in parameters.items():
-            # Skip fields we've already mapped to specific Component attributes
-            if key not in ["PN", "Comment"]:
-                properties[key] = str(value_str)
-
-        return Component(
-            refdes=refdes,
-            value=value,
-            footprint=footprint,
-            mpn=mpn,
-            page=page,
-            description=description,
-            pins=pins,
-            location=location,
-            properties=properties,
-            multipart_parent=None  # Altium sample data doesn't show multi-part
-        )
+            RuntimeError: If called before fetch_raw_data()
+        """
+        if not self._ready or self._parsed_data is None:
+            raise RuntimeError("Must call fetch_raw_data() before get_nets()")
 
-    def _transform_pins(self, pins_data: List[Dict[str, Any]]) -> List[Pin]:
+        return self.build_all()[1]
+
+    def _build_nets_from_columns(
+        self,
+        net_names: List[str],
+        comp_designators: List[str],
+        pin_designators: List[str],
+        page_names: List[str],
+    ) -> List[Net]:
         """
-        Transform Altium pin data to unified Pin objects.
+        Bucket flattened connectivity columns into Net objects.
 
-        Handles both numeric pin designators ("1", "2") and semantic pin names
-        ("VCC", "TX", "S", "G", "D").
+        For large designs the groupby is handed to pandas, which aggregates
+        in C instead of Python bytecode; otherwise a defaultdict pass buckets
+        the columns with one dict probe per pin.
 
         Args:
-            pins_data: List of pin dictionaries from Altium JSON
+            net_names: Net name per flattened pin
+            comp_designators: Component refdes per flattened pin
+            pin_designators: Pin designator per flattened pin
+            page_names: Page name per flattened pin
 
         Returns:
-            List of Pin objects
-        """
-        pins = []
-        for pin_data in pins_data:
-            pin_designator = pin_data.get("name", "")
-            net_name = pin_data.get("net", "")
-
-            # Handle empty net name (no-connect)
-            if not net_name:
-                net_name = "NC"
-
-            # Determine if pin name is semantic or just numeric
-            pin_name = ""
-            if self._is_semantic_pin_name(pin_designator):
-                pin_name = pin_designator
-
-            pin = Pin(
-                designator=pin_designator,
-                name=pin_name,
-                net=net_name
+            List of Net objects, one per distinct net name
+        """
+        if _pd is not None and len(net_names) >= _PANDAS_NET_THRESHOLD:
+            return self._build_nets_pandas(
+                net_names, comp_designators, pin_designators, page_names
             )
-            pins.append(pin)
 
-        return pins
+        # defaultdict turns the membership-check-then-insert pattern into a
+        # single dict probe per pin; the net name is reinjected from the key
+        # during the final conversion
+        nets_dict: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"pages": set(), "members": []}
+        )
+        # Canonicalize member tuples: with interned strings, a repeated
+        # (refdes, pin) pair collapses to one shared tuple object instead of
+        # a fresh 2-tuple allocation per occurrence
+        tuple_cache: Dict[tuple, tuple] = {}
+        for net_name, designator, pin_designator, page_name in zip(
+            net_names, comp_designators, pin_designators, page_names
+        ):
+            entry = nets_dict[net_name]
+            key = (designator, pin_designator)
+            entry["members"].append(tuple_cache.setdefault(key, key))
+            entry["pages"].add(page_name)
+
+        # Convert dict to Net objects. Page sets finalize as sorted
+        # tuples -- far smaller than sets for the 1-2 page spans typical
+        # of nets -- and are canonicalized: most nets share one of a
+        # handful of page combinations, so identical sets collapse to
+        # one object
+        page_set_cache: Dict[frozenset, Tuple[str, ...]] = {}
+        nets = []
+        for net_name, net_data in nets_dict.items():
+            key = frozenset(net_data["pages"])
+            pages = page_set_cache.get(key)
+            if pages is None:
+                pages = page_set_cache[key] = tuple(sorted(key))
+            nets.append(
+                Net(name=net_name, pages=pages, members=net_data["members"])
+            )
+        return nets
 
-    def _get_component_value(self, comp_data: Dict[str, Any]) -> str:
+    @staticmethod
+    def _build_nets_pandas(
+        net_names: List[str],
+        comp_designators: List[str],
+        pin_designators: List[str],
+        page_names: List[str],
+    ) -> List[Net]:
         """
-        Extract component value with fallback logic.
+        Aggregate the flattened pin columns into Net objects via pandas.
 
-        Priority:
-            1. parameters.Comment
-            2. parameters.PN
-            3. Empty string
+        Equivalent to the pure-Python bucketing pass in get_nets, but the
+        groupby runs in vectorized C — a large win once designs reach tens
+        of thousands of pins. Net order (first appearance) and member order
+        are preserved.
 
         Args:
-            comp_data: Component dictionary from Altium JSON
+            net_names: Net name per flattened pin
+            comp_designators: Component refdes per flattened pin
+            pin_designators: Pin designator per flattened pin
+            page_names: Page name per flattened pin
 
         Returns:
-            Component value string
+            List of Net objects, one per distinct net name
+        """
+        frame = _pd.DataFrame({
+            "net": net_names,
+            "member": list(zip(comp_designators, pin_designators)),
+            "page": page_names,
+        })
+        grouped = frame.groupby("net", sort=False)
+        members = grouped["member"].apply(list)
+        pages = grouped["page"].apply(frozenset)
+
+        page_set_cache: Dict[frozenset, Tuple[str, ...]] = {}
+        nets = []
+        for name in members.index:
+            key = pages[name]
+            page_tuple = page_set_cache.get(key)
+            if page_tuple is None:
+                page_tuple = page_set_cache[key] = tuple(sorted(key))
+            nets.append(Net(name=name, pages=page_tuple, members=members[name]))
+        return nets
+
+    def _transform_component(self, comp_data: Dict[str, Any]) -> Component:
         """
-        parameters = comp_data.get("parameters", {})
+        Transform a single Altium component dict to unified Component model.
 
-        # Try Comment first (most common for value)
-        comment = parameters.get("Comment", "")
-        if comment:
-            return comment
+        Thin wrapper around the module-level _transform_component, kept for
+        API compatibility.
+        """
+        return _transform_component(comp_data)
 
-        # Fallback to PN
-        pn = parameters.get("PN", "")
-        if pn:
-            return pn
+    def _transform_pins(self, pins_data: List[Dict[str, Any]]) -> List[Pin]:
+        """
+        Transform Altium pin data to unified Pin objects.
 
-        # Last resort: empty string
-        return ""
+        Thin wrapper around the module-level _transform_pins, kept for API
+        compatibility.
+        """
+        return _transform_pins(pins_data)
 
     def _extract_filename(self, full_path: str) -> str:
         """
         Extract filename from full Windows or Unix path.
 
-        Handles both forward slashes and backslashes. Returns just the filename
-        with extension, stripping all directory components.
-
-        Args:
-            full_path: Full path like "C:\\Users\\geoff\\project\\Main.SchDoc"
-
-        Returns:
-            Filename only, e.g., "Main.SchDoc"
-
-        Examples:
-            >>> _extract_filename("C:\\Users\\project\\Main.SchDoc")
-            "Main.SchDoc"
-            >>> _extract_filename("/home/user/project/Main.SchDoc")
-            "Main.SchDoc"
-            >>> _extract_filename("Main.SchDoc")
-            "Main.SchDoc"
+        Thin wrapper around the memoized module-level _extract_filename,
+        kept for API compatibility.
         """
-        if not full_path:
-            return ""
-
-        # Use os.path.basename which handles both Windows and Unix paths
-        filename = os.path.basename(full_path)
-        return filename
+        return _extract_filename(full_path)
 
     def _is_semantic_pin_name(self, pin_name: str) -> bool:
         """
         Determine if a pin name is semantic (meaningful) vs purely numeric.
 
-        Semantic pin names include things like:
-            - "VCC", "GND", "VOUT", "VIN"
-            - "TX", "RX", "SDA", "SCL"
-            - "S", "G", "D" (for transistors)
-            - "A", "K" (for diodes/LEDs) - BUT spec says these are simple
-            - "Shell" (for connectors)
-
-        Non-semantic (simple) pin names:
-            - Pure numbers: "1", "2", "22", "100"
-            - Single letters that are standard simple: "A", "K"
-            - Empty string
-
-        Args:
-            pin_name: Pin name/designator string
-
-        Returns:
-            True if pin name is semantic and should be included in Pin.name,
-            False if it's just a numeric/simple designator
-
-        Examples:
-            >>> _is_semantic_pin_name("1")
-            False
-            >>> _is_semantic_pin_name("22")
-            False
-            >>> _is_semantic_pin_name("VCC")
-            True
-            >>> _is_semantic_pin_name("TX")
-            True
-            >>> _is_semantic_pin_name("S")
-            True
-            >>> _is_semantic_pin_name("A")
-            False  # Standard simple anode/cathode
-            >>> _is_semantic_pin_name("K")
-            False
-            >>> _is_semantic_pin_name("")
-            False
-        """
-        if not pin_name:
-            return False
-
-        # Pure numeric strings are not semantic
-        if pin_name.isdigit():
-            return False
-
-        # Single-letter simple pin designators (per spec: "A", "K")
-        simple_single_letters = {"A", "K"}
-        if pin_name in simple_single_letters:
-            return False
-
-        # Everything else is considered semantic
-        # This includes:
-        #   - Multi-character names: "VCC", "GND", "TX", "RX", "SDA", "SCL"
-        #   - Single semantic letters: "S", "G", "D" (transistor pins)
-        #   - Special names: "Shell", "NC", etc.
-        return True
+        Thin wrapper around the memoized module-level _is_semantic_pin_name,
+        kept for API compatibility.
+        """
+        return _is_semantic_pin_name(pin_name)
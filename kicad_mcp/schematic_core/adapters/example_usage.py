@@ -8,6 +8,7 @@ schematic data and extract components and nets.
 import json
 import os
 import sys
+from collections import Counter
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -35,9 +36,10 @@ def main():
     print("="*60)
     print()
 
-    # Read the JSON file
+    # Read the JSON file (binary mode: the adapter accepts bytes directly,
+    # which skips a redundant decode when orjson is installed)
     print("1. Reading JSON file...")
-    with open(sample_path, 'r') as f:
+    with open(sample_path, 'rb') as f:
         json_data = f.read()
 
     # Create adapter and fetch data
@@ -115,22 +117,15 @@ def main():
     # Component type breakdown
     print()
     print("Component Type Breakdown:")
-    type_counts = {}
-    for comp in components:
-        comp_type = comp.derived_type()
-        type_counts[comp_type] = type_counts.get(comp_type, 0) + 1
-
-    for comp_type, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
+    type_counts = Counter(comp.derived_type() for comp in components)
+    for comp_type, count in type_counts.most_common():
         print(f"  {comp_type}: {count}")
 
     # Page breakdown
     print()
     print("Components per Page:")
-    page_counts = {}
-    for comp in components:
-        page_counts[comp.page] = page_counts.get(comp.page, 0) + 1
-
-    for page, count in sorted(page_counts.items(), key=lambda x: x[1], reverse=True):
+    page_counts = Counter(comp.page for comp in components)
+    for page, count in page_counts.most_common():
         print(f"  {page}: {count} components")
 
     print()
@@ -7,7 +7,15 @@ This is the Python equivalent of the DelphiScript used in the Altium adapter.
 This adapter parses .kicad_sch files and transforms them into the unified
 Component/Pin/Net model used by the schematic core library.
 """
-from typing import List, Dict, Any, Set, Optional
+import functools
+import logging
+import os
+import pickle
+import sys
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Set, Optional, Tuple
 from pathlib import Path
 
 from kicad_mcp.utils.netlist_parser import SchematicParser
@@ -16,6 +24,123 @@ from kicad_mcp.utils.netlist_xml_extractor import export_and_parse_netlist_xml
 from ..interfaces import SchematicProvider
 from ..models import Component, Pin, Net
 
+logger = logging.getLogger(__name__)
+
+try:
+    # Optional: vectorized net aggregation for very large designs
+    import pandas as _pd
+except ImportError:  # pragma: no cover - pandas is an optional speedup
+    _pd = None
+
+# Pin-net edge count above which net aggregation is offloaded to pandas
+_PANDAS_NET_THRESHOLD = 10000
+
+# Directory (inside the project root) holding cached per-sheet parse results
+_CACHE_DIR_NAME = ".kicad_mcp_cache"
+
+# Datasheet values with these exact schemes are URLs, not misfiled MPNs
+_URL_PREFIXES = ("http://", "https://")
+
+# Single-letter pin designators that are standard shorthand, not semantic
+# names (per spec: anode/cathode)
+_SIMPLE_LETTERS = frozenset({"A", "K"})
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_semantic_pin_name(pin_name: str) -> bool:
+    """
+    Determine if a pin name is semantic (meaningful) vs purely numeric.
+
+    Module-level and LRU-cached: the pin-name vocabulary of a design is
+    tiny compared to its pin count, so after warmup each call is a single
+    cache lookup shared across adapter instances.
+
+    Args:
+        pin_name: Pin name string
+
+    Returns:
+        True if pin name is semantic, False if simple
+    """
+    return bool(pin_name) and not pin_name.isdigit() and pin_name not in _SIMPLE_LETTERS
+
+
+def _parse_one_sheet(path: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Parse a single .kicad_sch file.
+
+    Module-level (rather than a method) so it is picklable and can run in
+    worker processes.
+
+    Args:
+        path: Path to the .kicad_sch file
+
+    Returns:
+        Tuple of (sheet name, parsed data dictionary)
+    """
+    parser = SchematicParser(path, is_hierarchical=False)
+    return Path(path).stem, parser.parse()
+
+
+def _parse_pcb(path: str) -> Dict[str, Dict[str, str]]:
+    """Load and parse a .kicad_pcb file (runs on the background executor)."""
+    return PCBNetlistParser(path).parse()
+
+
+# Single background worker used to overlap the PCB netlist parse with the
+# schematic parses; the regex/file work releases the GIL at the C level
+_PCB_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+class _LazySheets(Mapping):
+    """
+    Mapping of sheet name to parsed data with bounded residency.
+
+    Holds at most _MAX_LIVE parsed sheet dicts in memory (LRU eviction);
+    evicted sheets are reloaded on demand through the supplied loader,
+    which serves them from the on-disk parse cache when possible. This
+    keeps peak memory bounded for designs with dozens of sheets while
+    leaving iteration semantics identical to a plain dict.
+    """
+
+    _MAX_LIVE = 8
+
+    def __init__(self, loader: Callable[[Path], Dict[str, Any]]):
+        self._loader = loader
+        self._paths: Dict[str, Path] = {}
+        self._live: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def register(
+        self,
+        sheet_name: str,
+        path: Path,
+        parsed_data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record a sheet, optionally seeding its parsed data."""
+        self._paths[sheet_name] = path
+        if parsed_data is not None:
+            self._store(sheet_name, parsed_data)
+
+    def _store(self, sheet_name: str, parsed_data: Dict[str, Any]) -> None:
+        self._live[sheet_name] = parsed_data
+        self._live.move_to_end(sheet_name)
+        while len(self._live) > self._MAX_LIVE:
+            self._live.popitem(last=False)
+
+    def __getitem__(self, sheet_name: str) -> Dict[str, Any]:
+        if sheet_name in self._live:
+            self._live.move_to_end(sheet_name)
+            return self._live[sheet_name]
+        path = self._paths[sheet_name]  # KeyError for unknown sheets
+        parsed_data = self._loader(path)
+        self._store(sheet_name, parsed_data)
+        return parsed_data
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
 
 class KiCADSchematicAdapter(SchematicProvider):
     """
@@ -40,9 +165,14 @@ class KiCADSchematicAdapter(SchematicProvider):
             project_root: Path to the directory containing .kicad_sch files
         """
         self.project_root = Path(project_root)
-        self._parsed_sheets: Dict[str, Dict[str, Any]] = {}  # sheet_name -> parsed_data
+        # sheet_name -> parsed_data, LRU-bounded with reload-on-demand
+        self._parsed_sheets = _LazySheets(self._load_sheet)
         self._pcb_netlist: Dict[str, Dict[str, str]] = {}  # refdes -> {pad: net}
+        self._comp_to_page: Dict[str, str] = {}  # refdes -> sheet_name
         self._xml_netlist: Dict[str, Any] = {}  # XML netlist data with pin connectivity
+        self._components_cache: List[Component] = []
+        self._nets_cache: List[Net] = []
+        self._built = False
         self._ready = False
 
     def fetch_raw_data(self) -> None:
@@ -59,33 +189,91 @@ class KiCADSchematicAdapter(SchematicProvider):
             FileNotFoundError: If no .kicad_sch files found in project_root
             ValueError: If parsing fails on all schematic files
         """
-        # Find all .kicad_sch files
-        schematic_files = list(self.project_root.glob("*.kicad_sch"))
+        # Find all .kicad_sch and .kicad_pcb files in one directory scan;
+        # os.scandir skips the fnmatch/Path machinery of glob and hands back
+        # DirEntry objects whose stat results feed the sheet cache keys.
+        # Sorting makes the root-schematic and PCB choices deterministic
+        schematic_entries = []
+        pcb_files = []
+        for entry in os.scandir(self.project_root):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".kicad_sch"):
+                schematic_entries.append(entry)
+            elif entry.name.endswith(".kicad_pcb"):
+                pcb_files.append(Path(entry.path))
+        schematic_entries.sort(key=lambda e: e.name)
+        pcb_files.sort()
+        schematic_files = [Path(e.path) for e in schematic_entries]
 
         if not schematic_files:
             raise FileNotFoundError(
                 f"No .kicad_sch files found in {self.project_root}"
             )
 
-        # Parse each schematic file for component metadata
-        successful_parses = 0
-        root_schematic = None
-        for sch_file in schematic_files:
-            sheet_name = sch_file.stem
+        # Kick off the PCB netlist parse in the background so it overlaps
+        # with the schematic parsing; the result is only consulted if the
+        # XML netlist export fails
+        pcb_future = (
+            _PCB_EXECUTOR.submit(_parse_pcb, str(pcb_files[0])) if pcb_files else None
+        )
 
+        # Parse each schematic file for component metadata. Cached sheets are
+        # served from disk; the rest are CPU-bound and independent, so when
+        # there is more than one they are farmed out to a process pool
+        parsed_sheets: Dict[str, Dict[str, Any]] = {}
+        to_parse: List[Tuple[Path, Optional[Path]]] = []
+        for sch_file, entry in zip(schematic_files, schematic_entries):
             try:
-                parser = SchematicParser(str(sch_file), is_hierarchical=False)
-                parsed_data = parser.parse()
-                self._parsed_sheets[sheet_name] = parsed_data
-                successful_parses += 1
-
-                # Track the first schematic as root for netlist export
-                if root_schematic is None:
-                    root_schematic = sch_file
+                cache_path = self._sheet_cache_path(sch_file, entry.stat())
+            except OSError:
+                cache_path = None
+            parsed_data = self._load_sheet_cache(cache_path)
+            if parsed_data is not None:
+                parsed_sheets[sch_file.stem] = parsed_data
+            else:
+                to_parse.append((sch_file, cache_path))
+
+        if len(to_parse) > 1:
+            max_workers = min(len(to_parse), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_parse_one_sheet, str(sch_file)): (sch_file, cache_path)
+                    for sch_file, cache_path in to_parse
+                }
+                for future, (sch_file, cache_path) in futures.items():
+                    try:
+                        sheet_name, parsed_data = future.result()
+                    except (OSError, ValueError, KeyError, TypeError) as e:
+                        logger.warning("Failed to parse %s: %s", sch_file.stem, e)
+                        continue
+                    parsed_sheets[sheet_name] = parsed_data
+                    self._store_sheet_cache(cache_path, parsed_data)
+        else:
+            # Serial fallback: not worth spawning workers for a single sheet
+            for sch_file, cache_path in to_parse:
+                try:
+                    sheet_name, parsed_data = _parse_one_sheet(str(sch_file))
+                except (OSError, ValueError, KeyError, TypeError) as e:
+                    logger.warning("Failed to parse %s: %s", sch_file.stem, e)
+                    continue
+                parsed_sheets[sheet_name] = parsed_data
+                self._store_sheet_cache(cache_path, parsed_data)
 
-            except Exception as e:
-                print(f"Warning: Failed to parse {sheet_name}: {e}")
+        # Record sheets in file order and track the first schematic as root
+        # for netlist export
+        successful_parses = 0
+        root_schematic = None
+        for sch_file in schematic_files:
+            parsed_data = parsed_sheets.get(sch_file.stem)
+            if parsed_data is None:
                 continue
+            self._parsed_sheets.register(sch_file.stem, sch_file, parsed_data)
+            for comp_ref in parsed_data.get("components", {}):
+                self._comp_to_page[comp_ref] = sch_file.stem
+            successful_parses += 1
+            if root_schematic is None:
+                root_schematic = sch_file
 
         if successful_parses == 0:
             raise ValueError(
@@ -96,59 +284,57 @@ class KiCADSchematicAdapter(SchematicProvider):
         xml_netlist_success = False
         if root_schematic:
             try:
-                print(f"Exporting XML netlist from {root_schematic.name}...")
+                logger.info("Exporting XML netlist from %s...", root_schematic.name)
                 self._xml_netlist = export_and_parse_netlist_xml(str(root_schematic))
                 xml_component_count = self._xml_netlist.get('component_count', 0)
-                print(f"Extracted {xml_component_count} components with pin connectivity from XML netlist")
+                logger.info("Extracted %s components with pin connectivity from XML netlist", xml_component_count)
                 xml_netlist_success = True
 
                 # Convert XML netlist format to PCB netlist format for compatibility
                 for comp_ref, comp_data in self._xml_netlist.get('components', {}).items():
+                    # Intern the keys/net names so the many duplicates across
+                    # pins, nets and components share single string objects
                     pins_dict = {}
                     for pin_num, pin_info in comp_data.get('pins', {}).items():
-                        pins_dict[pin_num] = pin_info.get('net', '')
+                        pins_dict[sys.intern(pin_num)] = sys.intern(pin_info.get('net', ''))
                     if pins_dict:
-                        self._pcb_netlist[comp_ref] = pins_dict
+                        self._pcb_netlist[sys.intern(comp_ref)] = pins_dict
 
             except Exception as e:
-                print(f"Warning: Failed to export XML netlist: {e}")
-                print("Falling back to PCB file netlist parsing...")
+                logger.warning("Failed to export XML netlist: %s", e)
+                logger.info("Falling back to PCB file netlist parsing...")
 
         # Fallback to PCB file for netlist connectivity (if XML failed)
         if not xml_netlist_success:
-            pcb_files = list(self.project_root.glob("*.kicad_pcb"))
-            if pcb_files:
+            if pcb_future is not None:
                 try:
-                    print(f"Parsing PCB netlist from {pcb_files[0].name}...")
-                    pcb_parser = PCBNetlistParser(str(pcb_files[0]))
-                    self._pcb_netlist = pcb_parser.parse()
-                    print(f"Extracted connectivity for {len(self._pcb_netlist)} components")
+                    logger.info("Parsing PCB netlist from %s...", pcb_files[0].name)
+                    self._pcb_netlist = pcb_future.result()
+                    logger.info("Extracted connectivity for %s components", len(self._pcb_netlist))
                 except Exception as e:
-                    print(f"Warning: Failed to parse PCB netlist: {e}")
-                    print("Continuing without pin connectivity data...")
+                    logger.warning("Failed to parse PCB netlist: %s", e)
+                    logger.info("Continuing without pin connectivity data...")
             else:
-                print("Warning: No .kicad_pcb file found - pin connectivity unavailable")
+                logger.warning("No .kicad_pcb file found - pin connectivity unavailable")
 
         self._ready = True
+        self._build_all()
 
-    def get_components(self) -> List[Component]:
+    def _build_all(self) -> None:
         """
-        Extract all components from parsed KiCAD schematics.
-
-        Transforms KiCAD component data into unified Component objects with
-        Pin connectivity information.
+        Build components and nets in one fused pass over the parsed data.
 
-        Returns:
-            List of Component objects from all schematic sheets
-
-        Raises:
-            RuntimeError: If called before fetch_raw_data()
+        Both extractions walk the same parsed sheets and PCB netlist, so
+        doing them together avoids re-traversing the dict-of-dicts once per
+        accessor. Results are cached; get_components/get_nets just return
+        the cached lists.
         """
-        if not self._ready:
-            raise RuntimeError("Must call fetch_raw_data() before get_components()")
-
-        components = []
+        # Component-to-page mapping was built as sheets were recorded in
+        # fetch_raw_data
+        comp_to_page = self._comp_to_page
 
+        # Pass 1: components
+        components: List[Component] = []
         for sheet_name, parsed_data in self._parsed_sheets.items():
             comp_info = parsed_data.get("components", {})
 
@@ -160,11 +346,183 @@ class KiCADSchematicAdapter(SchematicProvider):
                         sheet_name
                     )
                     components.append(component)
-                except Exception as e:
-                    print(f"Warning: Failed to transform component {comp_ref}: {e}")
+                except (AttributeError, KeyError, TypeError, ValueError) as e:
+                    logger.warning("Failed to transform component %s: %s", comp_ref, e)
                     continue
 
-        return components
+        # Pass 2: nets from PCB netlist connectivity. Large designs are
+        # offloaded to a vectorized pandas groupby; otherwise two
+        # defaultdicts keep the hot loop at a single hash probe per
+        # structure instead of the membership-test-then-index pattern
+        edge_count = sum(len(pin_nets) for pin_nets in self._pcb_netlist.values())
+        if _pd is not None and edge_count >= _PANDAS_NET_THRESHOLD:
+            nets = self._build_nets_pandas(comp_to_page)
+        else:
+            members: Dict[str, List[Any]] = defaultdict(list)
+            pages: Dict[str, Set[str]] = defaultdict(set)
+
+            for comp_ref, pin_nets in self._pcb_netlist.items():
+                # Get the page this component is on
+                page = comp_to_page.get(comp_ref, "unknown")
+
+                for pin_num, net_name in pin_nets.items():
+                    # Empty net name means no-connect
+                    net_name = net_name or "NC"
+                    members[net_name].append((comp_ref, pin_num))
+                    pages[net_name].add(page)
+
+            # Sorted tuples are far smaller than sets for the 1-2 page
+            # spans typical of nets, and make the nets safe to share or
+            # cache downstream
+            nets = [
+                Net(
+                    name=net_name,
+                    pages=tuple(sorted(pages[net_name])),
+                    members=tuple(net_members)
+                )
+                for net_name, net_members in members.items()
+            ]
+
+        self._components_cache = components
+        self._nets_cache = nets
+        self._built = True
+
+    def _build_nets_pandas(self, comp_to_page: Dict[str, str]) -> List[Net]:
+        """
+        Aggregate pin-net edges into Net objects via a pandas groupby.
+
+        Flattens the netlist into parallel columns and lets the groupby run
+        in vectorized C, mirroring the Altium adapter's large-design path.
+        Net order (first appearance) and member order are preserved.
+
+        Args:
+            comp_to_page: Mapping from refdes to sheet name
+
+        Returns:
+            List of Net objects, one per distinct net name
+        """
+        net_names: List[str] = []
+        edge_members: List[Any] = []
+        page_names: List[str] = []
+        for comp_ref, pin_nets in self._pcb_netlist.items():
+            page = comp_to_page.get(comp_ref, "unknown")
+            for pin_num, net_name in pin_nets.items():
+                net_names.append(net_name or "NC")
+                edge_members.append((comp_ref, pin_num))
+                page_names.append(page)
+
+        frame = _pd.DataFrame({
+            "net": net_names,
+            "member": edge_members,
+            "page": page_names,
+        })
+        grouped = frame.groupby("net", sort=False)
+        members = grouped["member"].apply(tuple)
+        pages = grouped["page"].apply(lambda p: tuple(sorted(set(p))))
+
+        return [
+            Net(name=name, pages=pages[name], members=members[name])
+            for name in members.index
+        ]
+
+    def _load_sheet(self, sch_file: Path) -> Dict[str, Any]:
+        """
+        Load a sheet's parsed data for _LazySheets, preferring the disk cache.
+
+        Args:
+            sch_file: Path to the .kicad_sch file
+
+        Returns:
+            Parsed data dictionary for the sheet
+        """
+        cache_path = self._sheet_cache_path(sch_file)
+        parsed_data = self._load_sheet_cache(cache_path)
+        if parsed_data is None:
+            _, parsed_data = _parse_one_sheet(str(sch_file))
+            self._store_sheet_cache(cache_path, parsed_data)
+        return parsed_data
+
+    def _sheet_cache_path(
+        self,
+        sch_file: Path,
+        stat: Optional[os.stat_result] = None
+    ) -> Optional[Path]:
+        """
+        Compute the cache file path for a schematic sheet.
+
+        The cache key combines the file name, modification time and size, so
+        an edited sheet automatically gets a fresh parse while unchanged
+        sheets are served from disk.
+
+        Args:
+            sch_file: Path to the .kicad_sch file
+            stat: Pre-fetched stat result (e.g. from a DirEntry), to avoid
+                a second stat syscall
+
+        Returns:
+            Path inside the project-local cache directory, or None if the
+            file cannot be stat'd
+        """
+        if stat is None:
+            try:
+                stat = sch_file.stat()
+            except OSError:
+                return None
+        return (
+            self.project_root / _CACHE_DIR_NAME /
+            f"{sch_file.name}.{stat.st_mtime_ns}.{stat.st_size}.pkl"
+        )
+
+    @staticmethod
+    def _load_sheet_cache(cache_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """Load a cached parse result, or None on any cache miss/error."""
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # Corrupt or stale cache entry - fall back to a real parse.
+            # pickle.load can raise ValueError, ImportError and
+            # IndexError besides UnpicklingError, so treat any failure
+            # here as a miss
+            return None
+
+    @staticmethod
+    def _store_sheet_cache(cache_path: Optional[Path], parsed_data: Dict[str, Any]) -> None:
+        """Persist a parse result to the cache; failures are non-fatal."""
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a sibling temp file and rename into place so a
+            # killed process can never leave a truncated entry behind
+            tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(parsed_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    def get_components(self) -> List[Component]:
+        """
+        Extract all components from parsed KiCAD schematics.
+
+        Transforms KiCAD component data into unified Component objects with
+        Pin connectivity information.
+
+        Returns:
+            List of Component objects from all schematic sheets
+
+        Raises:
+            RuntimeError: If called before fetch_raw_data()
+        """
+        if not self._ready:
+            raise RuntimeError("Must call fetch_raw_data() before get_components()")
+
+        if not self._built:
+            self._build_all()
+        return self._components_cache
 
     def get_nets(self) -> List[Net]:
         """
@@ -182,48 +540,9 @@ class KiCADSchematicAdapter(SchematicProvider):
         if not self._ready:
             raise RuntimeError("Must call fetch_raw_data() before get_nets()")
 
-        # Build component-to-page mapping
-        comp_to_page: Dict[str, str] = {}
-        for sheet_name, parsed_data in self._parsed_sheets.items():
-            comp_info = parsed_data.get("components", {})
-            for comp_ref in comp_info.keys():
-                comp_to_page[comp_ref] = sheet_name
-
-        # Build nets from PCB netlist connectivity
-        nets_dict: Dict[str, Dict[str, Any]] = {}
-
-        for comp_ref, pin_nets in self._pcb_netlist.items():
-            # Get the page this component is on
-            page = comp_to_page.get(comp_ref, "unknown")
-
-            for pin_num, net_name in pin_nets.items():
-                # Handle empty net name (no-connect)
-                if not net_name:
-                    net_name = "NC"
-
-                # Initialize net entry if not seen before
-                if net_name not in nets_dict:
-                    nets_dict[net_name] = {
-                        "name": net_name,
-                        "pages": set(),
-                        "members": []
-                    }
-
-                # Add this pin to the net
-                nets_dict[net_name]["members"].append((comp_ref, pin_num))
-                nets_dict[net_name]["pages"].add(page)
-
-        # Convert dict to Net objects
-        nets = []
-        for net_data in nets_dict.values():
-            net = Net(
-                name=net_data["name"],
-                pages=net_data["pages"],
-                members=net_data["members"]
-            )
-            nets.append(net)
-
-        return nets
+        if not self._built:
+            self._build_all()
+        return self._nets_cache
 
     def _transform_component(
         self,
@@ -242,6 +561,10 @@ class KiCADSchematicAdapter(SchematicProvider):
         Returns:
             Component object with all fields populated
         """
+        # Intern the refdes: it is duplicated across pins, net members and
+        # page maps, so identical bytes should share one string object
+        comp_ref = sys.intern(comp_ref)
+
         # Extract basic fields
         value = comp_data.get("value", "")
         footprint = comp_data.get("footprint", "")
@@ -250,18 +573,19 @@ class KiCADSchematicAdapter(SchematicProvider):
         datasheet = comp_data.get("datasheet", "")
         properties_dict = comp_data.get("properties", {})
 
-        # Try to get MPN from properties first, then datasheet
-        mpn = properties_dict.get("PN", "")
-        if not mpn:
-            mpn = properties_dict.get("MPN", "")
-        if not mpn and datasheet and not datasheet.startswith("http"):
-            mpn = datasheet
+        # MPN priority: PN property, then MPN property, then a datasheet
+        # value that is not actually a URL. One or-chained expression keeps
+        # the per-component fallback to a single bytecode block
+        mpn = (
+            properties_dict.get("PN")
+            or properties_dict.get("MPN")
+            or (datasheet if datasheet and not datasheet.startswith(_URL_PREFIXES) else "")
+        )
 
-        # Build description from lib_id or properties
+        # Build description from lib_id or properties. rpartition avoids the
+        # throwaway list that split() would allocate per component
         lib_id = comp_data.get("lib_id", "")
-        description = properties_dict.get("Description", "")
-        if not description and lib_id:
-            description = lib_id.split(":")[-1]
+        description = properties_dict.get("Description") or lib_id.rpartition(":")[2]
 
         # Transform pins - use PCB netlist if available
         pins = self._transform_pins(comp_ref, comp_data.get("pins", {}))
@@ -272,14 +596,15 @@ class KiCADSchematicAdapter(SchematicProvider):
         y = position.get("y", 0)
         location = (x, y)
 
-        # Additional properties
-        properties = {}
+        # Additional properties: start from the parameter dict and insert
+        # the component-level fields afterward so they win over any
+        # same-named parameters (the old update() order silently let
+        # parameters overwrite them)
+        properties = dict(properties_dict)
         if lib_id:
             properties["lib_id"] = lib_id
         if datasheet:
             properties["datasheet"] = datasheet
-        # Add all component properties
-        properties.update(properties_dict)
 
         return Component(
             refdes=comp_ref,
@@ -320,14 +645,16 @@ class KiCADSchematicAdapter(SchematicProvider):
                 pin_sch_data = pins_data.get(pin_num, {})
                 pin_name = pin_sch_data.get("name", pin_num)
 
+                pin_num = sys.intern(pin_num)
                 # Handle empty net name (no-connect)
-                if not net_name:
-                    net_name = "NC"
+                net_name = sys.intern(net_name or "NC")
 
                 # Determine if pin name is semantic or just numeric
                 semantic_name = ""
-                if self._is_semantic_pin_name(pin_name):
-                    semantic_name = pin_name
+                if _is_semantic_pin_name(pin_name):
+                    # Interned: names like VCC/GND/TX repeat across
+                    # most components in a design
+                    semantic_name = sys.intern(pin_name)
 
                 pin = Pin(
                     designator=pin_num,
@@ -341,14 +668,16 @@ class KiCADSchematicAdapter(SchematicProvider):
                 net_name = pin_data.get("net", "")
                 pin_name = pin_data.get("name", pin_num)
 
+                pin_num = sys.intern(pin_num)
                 # Handle empty net name (no-connect)
-                if not net_name:
-                    net_name = "NC"
+                net_name = sys.intern(net_name or "NC")
 
                 # Determine if pin name is semantic or just numeric
                 semantic_name = ""
-                if self._is_semantic_pin_name(pin_name):
-                    semantic_name = pin_name
+                if _is_semantic_pin_name(pin_name):
+                    # Interned: names like VCC/GND/TX repeat across
+                    # most components in a design
+                    semantic_name = sys.intern(pin_name)
 
                 pin = Pin(
                     designator=pin_num,
@@ -363,14 +692,8 @@ class KiCADSchematicAdapter(SchematicProvider):
         """
         Determine if a pin name is semantic (meaningful) vs purely numeric.
 
-        Semantic pin names include:
-            - Power pins: "VCC", "GND", "VOUT", "VIN"
-            - Signal pins: "TX", "RX", "SDA", "SCL"
-            - Transistor pins: "S", "G", "D"
-
-        Non-semantic (simple) pin names:
-            - Pure numbers: "1", "2", "22"
-            - Standard simple: "A", "K"
+        Thin wrapper around the cached module-level helper, kept for
+        API compatibility.
 
         Args:
             pin_name: Pin name string
@@ -378,17 +701,4 @@ class KiCADSchematicAdapter(SchematicProvider):
         Returns:
             True if pin name is semantic, False if simple
         """
-        if not pin_name:
-            return False
-
-        # Pure numeric strings are not semantic
-        if pin_name.isdigit():
-            return False
-
-        # Single-letter simple pin designators (per spec)
-        simple_single_letters = {"A", "K"}
-        if pin_name in simple_single_letters:
-            return False
-
-        # Everything else is semantic
-        return True
+        return _is_semantic_pin_name(pin_name)
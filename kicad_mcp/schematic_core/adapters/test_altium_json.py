@@ -89,17 +89,20 @@ def test_pin_transformation():
     pins = components[0].pins
     assert len(pins) == 4
 
+    # Index once, query many: O(pins) instead of a scan per lookup
+    by_des = {p.designator: p for p in pins}
+
     # Semantic pins should have name populated
-    s_pin = next(p for p in pins if p.designator == "S")
+    s_pin = by_des["S"]
     assert s_pin.name == "S"
     assert s_pin.net == "VOUT"
 
-    g_pin = next(p for p in pins if p.designator == "G")
+    g_pin = by_des["G"]
     assert g_pin.name == "G"
     assert g_pin.net == "GATE"
 
     # Numeric pin should have empty name
-    pin_1 = next(p for p in pins if p.designator == "1")
+    pin_1 = by_des["1"]
     assert pin_1.name == ""
     assert pin_1.net == "TEST"
 
@@ -133,8 +136,9 @@ def test_no_connect_pins():
     components = adapter.get_components()
 
     pins = components[0].pins
-    pin_1 = next(p for p in pins if p.designator == "1")
-    pin_3 = next(p for p in pins if p.designator == "3")
+    by_des = {p.designator: p for p in pins}
+    pin_1 = by_des["1"]
+    pin_3 = by_des["3"]
 
     # Empty net should become "NC"
     assert pin_1.net == "NC"
@@ -184,8 +188,10 @@ def test_net_building():
     # Should have 3 nets: VCC, GND, OUTPUT
     assert len(nets) == 3
 
+    by_name = {n.name: n for n in nets}
+
     # Find VCC net
-    vcc_net = next(n for n in nets if n.name == "VCC")
+    vcc_net = by_name["VCC"]
     assert len(vcc_net.members) == 3  # U1.1, C1.1, R1.1
     assert ("U1", "1") in vcc_net.members
     assert ("C1", "1") in vcc_net.members
@@ -197,7 +203,7 @@ def test_net_building():
     assert "Power.SchDoc" in vcc_net.pages
 
     # GND only on Main.SchDoc
-    gnd_net = next(n for n in nets if n.name == "GND")
+    gnd_net = by_name["GND"]
     assert len(gnd_net.pages) == 1
     assert "Main.SchDoc" in gnd_net.pages
 
@@ -312,9 +318,10 @@ def test_multipin_same_net():
 
     # Net should have all 6 connections
     nets = adapter.get_nets()
-    vout_net = next(n for n in nets if n.name == "VOUT")
-    vin_net = next(n for n in nets if n.name == "VIN")
-    gate_net = next(n for n in nets if n.name == "GATE")
+    by_name = {n.name: n for n in nets}
+    vout_net = by_name["VOUT"]
+    vin_net = by_name["VIN"]
+    gate_net = by_name["GATE"]
 
     # VOUT has 3 S pins
     assert len([m for m in vout_net.members if m[0] == "Q1"]) == 3
@@ -420,15 +427,18 @@ def test_sample_json_file():
     assert len(components) > 0, "Sample should have components"
     assert len(nets) > 0, "Sample should have nets"
 
+    by_refdes = {c.refdes: c for c in components}
+    by_name = {n.name: n for n in nets}
+
     # Check a specific component (U1 from sample)
-    u1 = next((c for c in components if c.refdes == "U1"), None)
+    u1 = by_refdes.get("U1")
     if u1:
         assert u1.description == "IC GATE DRVR N-CH MOSFET 16 MSOP"
         assert u1.mpn == "LTC7003EMSE#TRPBF"
         assert len(u1.pins) == 17
 
     # Check net building worked
-    gnd_net = next((n for n in nets if n.name == "GND"), None)
+    gnd_net = by_name.get("GND")
     if gnd_net:
         assert len(gnd_net.members) > 0
 
@@ -7,7 +7,6 @@ unified data model (Component.derived_type(), Component.is_complex(),
 Net.is_global(), etc.).
 """
 
-import json
 import sys
 import os
 
@@ -19,7 +18,7 @@ from schematic_core.adapters.altium_json import AltiumJSONAdapter
 
 def test_component_derived_properties():
     """Test that Component derived properties work correctly."""
-    json_data = json.dumps({
+    design_data = {
         "components": [
             {
                 "designator": "R1",
@@ -58,9 +57,9 @@ def test_component_derived_properties():
                 ]
             }
         ]
-    })
+    }
 
-    adapter = AltiumJSONAdapter(json_data)
+    adapter = AltiumJSONAdapter.from_dict(design_data)
     adapter.fetch_raw_data()
     components = adapter.get_components()
 
@@ -94,7 +93,7 @@ def test_component_derived_properties():
 
 def test_net_derived_properties():
     """Test that Net derived properties work correctly."""
-    json_data = json.dumps({
+    design_data = {
         "components": [
             # GND on many components (should be global)
             {
@@ -140,9 +139,9 @@ def test_net_derived_properties():
                 "pins": [{"name": "1", "net": "3V3"}]
             }
         ]
-    })
+    }
 
-    adapter = AltiumJSONAdapter(json_data)
+    adapter = AltiumJSONAdapter.from_dict(design_data)
     adapter.fetch_raw_data()
     nets = adapter.get_nets()
 
@@ -170,7 +169,7 @@ def test_net_derived_properties():
 
 def test_pin_data_integrity():
     """Test that Pin objects preserve all data correctly."""
-    json_data = json.dumps({
+    design_data = {
         "components": [
             {
                 "designator": "U1",
@@ -184,9 +183,9 @@ def test_pin_data_integrity():
                 ]
             }
         ]
-    })
+    }
 
-    adapter = AltiumJSONAdapter(json_data)
+    adapter = AltiumJSONAdapter.from_dict(design_data)
     adapter.fetch_raw_data()
     components = adapter.get_components()
 
@@ -222,7 +221,7 @@ def test_pin_data_integrity():
 
 def test_properties_extraction():
     """Test that component properties are correctly extracted."""
-    json_data = json.dumps({
+    design_data = {
         "components": [
             {
                 "designator": "R1",
@@ -238,9 +237,9 @@ def test_properties_extraction():
                 "pins": []
             }
         ]
-    })
+    }
 
-    adapter = AltiumJSONAdapter(json_data)
+    adapter = AltiumJSONAdapter.from_dict(design_data)
     adapter.fetch_raw_data()
     components = adapter.get_components()
 
@@ -263,7 +262,7 @@ def test_properties_extraction():
 
 def test_location_data():
     """Test that location data is captured correctly."""
-    json_data = json.dumps({
+    design_data = {
         "components": [
             {
                 "designator": "U1",
@@ -281,9 +280,9 @@ def test_location_data():
                 "pins": []
             }
         ]
-    })
+    }
 
-    adapter = AltiumJSONAdapter(json_data)
+    adapter = AltiumJSONAdapter.from_dict(design_data)
     adapter.fetch_raw_data()
     components = adapter.get_components()
 
@@ -298,7 +297,7 @@ def test_location_data():
 
 def test_multi_page_design():
     """Test handling of design spanning multiple pages."""
-    json_data = json.dumps({
+    design_data = {
         "components": [
             {
                 "designator": "U1",
@@ -328,9 +327,9 @@ def test_multi_page_design():
                 ]
             }
         ]
-    })
+    }
 
-    adapter = AltiumJSONAdapter(json_data)
+    adapter = AltiumJSONAdapter.from_dict(design_data)
     adapter.fetch_raw_data()
     components = adapter.get_components()
     nets = adapter.get_nets()
@@ -14,28 +14,96 @@ Key Features:
 - Inter-page links: Show LINKS line for nets spanning multiple pages
 """
 
-from typing import List, Dict, Set, Tuple
+import functools
+import heapq
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, FrozenSet, List, Dict, Optional, Set, TextIO, Tuple
+
 try:
     from .models import Component, Net, Pin
 except ImportError:
     from models import Component, Net, Pin
 
+# Splits runs of digits out of a designator for natural sorting
+_NAT_SORT_RE = re.compile(r'(\d+)')
+
+# Below this page count, worker startup and model pickling cost more than
+# the emission itself, so emit_all_pages stays serial
+_PARALLEL_PAGE_THRESHOLD = 4
+
+# Pin names that don't warrant the parenthesized hint in net connections;
+# hoisted so the per-pin formatting path doesn't rebuild the set
+_SIMPLE_PIN_NAMES = frozenset({"1", "2", "3", "4", "A", "K"})
+
+# Shared fallback for nets missing from the Atlas; avoids allocating a
+# fresh empty set per net in the emission loop
+_EMPTY_PAGES: FrozenSet[str] = frozenset()
+
 
 def emit_page_dsl(
     components: List[Component],
     nets: List[Net],
-    net_page_map: Dict[str, Set[str]]
+    net_page_map: Dict[str, Set[str]],
+    already_sorted: bool = False,
+    block_cache: Optional[Dict[Tuple, str]] = None
 ) -> str:
     """
-    Generate DSL for a single schematic page.
+    Generate DSL for a single schematic page as one string.
+
+    Thin wrapper over emit_page_dsl_stream; callers that write the DSL
+    straight to a file or stream should use that instead and skip the
+    whole-page intermediate string.
 
     Args:
         components: List of components on this page
         nets: List of nets with pins on this page
         net_page_map: Dict mapping net names to set of page names (the Atlas)
+        already_sorted: Skip the internal sorts when the caller guarantees
+                        components are ordered by refdes and nets by name
+        block_cache: Optional pre-rendered net blocks (keyed by net name)
+                     for nets whose block is identical on every page
 
     Returns:
         Formatted DSL string for the page
+    """
+    if not components:
+        return "# No components on this page\n"
+
+    buf = io.StringIO()
+    emit_page_dsl_stream(
+        components, nets, net_page_map, buf, already_sorted, block_cache
+    )
+    # Drop the final line terminator to match the historical join() output
+    return buf.getvalue()[:-1]
+
+
+def emit_page_dsl_stream(
+    components: List[Component],
+    nets: List[Net],
+    net_page_map: Dict[str, Set[str]],
+    out: TextIO,
+    already_sorted: bool = False,
+    block_cache: Optional[Dict[Tuple, str]] = None
+) -> None:
+    """
+    Write DSL for a single schematic page directly to a text stream.
+
+    Peak memory stays proportional to a single block rather than the
+    whole page, which matters for dense pages (an FPGA sheet emits
+    megabytes of DSL).
+
+    Args:
+        components: List of components on this page
+        nets: List of nets with pins on this page
+        net_page_map: Dict mapping net names to set of page names (the Atlas)
+        out: Text stream receiving newline-terminated DSL lines
+        already_sorted: Skip the internal sorts when the caller guarantees
+                        components are ordered by refdes and nets by name
+        block_cache: Optional pre-rendered net blocks (keyed by net name)
+                     for nets whose block is identical on every page
 
     Format:
         # PAGE: <page_name>
@@ -47,42 +115,174 @@ def emit_page_dsl(
         <net blocks>
     """
     if not components:
-        return "# No components on this page\n"
+        out.write("# No components on this page\n")
+        return
 
     # Get page name from first component
-    page_name = components[0].page if components else "Unknown"
-
-    # Sort components alphabetically by refdes
-    sorted_components = sorted(components, key=lambda c: c.refdes)
+    page_name = components[0].page
 
-    # Sort nets alphabetically by name
-    sorted_nets = sorted(nets, key=lambda n: n.name)
-
-    # Build output
-    lines = [f"# PAGE: {page_name}", ""]
+    if already_sorted:
+        sorted_components = components
+        sorted_nets = nets
+    else:
+        # Sort components alphabetically by refdes, nets by name
+        sorted_components = sorted(components, key=lambda c: c.refdes)
+        sorted_nets = sorted(nets, key=lambda n: n.name)
+
+    # The block helpers write newline-terminated lines directly instead
+    # of returning strings that would be joined again here
+    write = out.write
+    write(f"# PAGE: {page_name}\n\n")
+
+    # Single pass over the components: partition out the complex ones
+    # and build the refdes/pin indexes the NETS section needs, instead
+    # of three separate traversals
+    complex_components = []
+    comp_index = {}
+    pin_index = {}
+    for c in sorted_components:
+        comp_index[c.refdes] = c
+        pin_index[c.refdes] = c.pin_by_designator()
+        if c.is_complex():
+            complex_components.append(c)
 
     # COMPONENTS section - only complex components get blocks
-    lines.append("# COMPONENTS")
-    complex_components = [c for c in sorted_components if c.is_complex()]
-
+    write("# COMPONENTS\n")
     if not complex_components:
-        lines.append("(All components are simple passives - see NETS section)")
+        write("(All components are simple passives - see NETS section)\n")
     else:
         for comp in complex_components:
-            block = _format_component_block(comp)
-            lines.append(block)
+            _format_component_block(comp, write)
 
-    lines.append("")
+    write("\n")
 
     # NETS section
-    lines.append("# NETS")
+    write("# NETS\n")
+    page_refdes = comp_index.keys()
+    get_net_pages = net_page_map.get
     for net in sorted_nets:
+        # Skip nets with no members on this page; any() short-circuits on
+        # the first on-page refdes, so foreign nets cost one set probe per
+        # member at most
+        if net.members and not any(
+            refdes in page_refdes for refdes, _ in net.members
+        ):
+            continue
         # Use net_page_map to determine if net is inter-page
-        net_pages = net_page_map.get(net.name, set())
-        block = _format_net_block(net, net_pages, sorted_components)
-        lines.append(block)
+        net_pages = get_net_pages(net.name, _EMPTY_PAGES)
+        if block_cache is not None:
+            # Read-only: emit_design pre-renders the blocks it proved
+            # page-invariant; anything else is formatted per page
+            block = block_cache.get(net.name)
+            if block is not None:
+                write(block)
+                continue
+        _format_net_block(net, net_pages, pin_index, write)
+
+
+def emit_design(
+    components: List[Component],
+    nets: List[Net],
+    net_page_map: Dict[str, Set[str]]
+) -> Dict[str, str]:
+    """
+    Emit DSL for every page of a design, sorting the inputs only once.
+
+    Per-page emission re-sorts its slice of components and nets on every
+    call; for a whole project that repeats O(pages) times. This sorts the
+    design-wide lists once, bucket-splits them per page (buckets inherit
+    the master order, so no re-sort is needed), and emits each page with
+    the sorts skipped.
+
+    Args:
+        components: All components in the design
+        nets: All nets in the design
+        net_page_map: Dict mapping net names to set of page names (the Atlas)
+
+    Returns:
+        Dict mapping page name to its DSL string, in page-name order
+    """
+    sorted_components = sorted(components, key=lambda c: c.refdes)
+    sorted_nets = sorted(nets, key=lambda n: n.name)
+
+    page_components: Dict[str, List[Component]] = {}
+    for component in sorted_components:
+        page_components.setdefault(component.page, []).append(component)
+
+    page_nets: Dict[str, List[Net]] = {}
+    for net in sorted_nets:
+        for page in net_page_map.get(net.name, net.pages):
+            page_nets.setdefault(page, []).append(net)
+
+    # Pre-render multi-page nets whose block is provably identical on
+    # every page. A page adds the (name) hint only for members whose pin
+    # resolves on that page with a semantic name, so a net with no
+    # semantic member pins anywhere - the GND/VCC-through-passives case -
+    # formats the same everywhere and is rendered once here. The check
+    # runs against the design-wide pin tables, which a single page cannot
+    # see; per-page caching on block content would serve stale hints.
+    design_pins = {c.refdes: c.pin_by_designator() for c in sorted_components}
+    block_cache: Dict[str, str] = {}
+    for net in sorted_nets:
+        net_pages = net_page_map.get(net.name, net.pages)
+        if len(net_pages) < 2:
+            continue
+        if any(
+            (pin := pins.get(p)) is not None
+            and pin.name
+            and pin.name not in _SIMPLE_PIN_NAMES
+            for r, p in net.members
+            if (pins := design_pins.get(r)) is not None
+        ):
+            continue
+        block_buf = io.StringIO()
+        _format_net_block(net, net_pages, design_pins, block_buf.write)
+        block_cache[net.name] = block_buf.getvalue()
+
+    return {
+        page: emit_page_dsl(
+            page_components[page],
+            page_nets.get(page, []),
+            net_page_map,
+            already_sorted=True,
+            block_cache=block_cache,
+        )
+        for page in sorted(page_components)
+    }
+
+
+def emit_all_pages(
+    pages: List[Tuple[List[Component], List[Net]]],
+    net_page_map: Dict[str, Set[str]]
+) -> List[str]:
+    """
+    Generate DSL for multiple schematic pages, in parallel on large designs.
+
+    Pages are independent (no shared mutable state) and emission is
+    CPU-bound pure Python, so large designs are fanned out across a
+    process pool; the models are plain dataclasses and pickle cheaply.
+    Small designs are emitted serially, where pool startup would dominate.
 
-    return "\n".join(lines)
+    Args:
+        pages: (components, nets) pair per page, in output order
+        net_page_map: Dict mapping net names to set of page names (the Atlas)
+
+    Returns:
+        DSL string per page, in the same order as the input
+    """
+    if len(pages) < _PARALLEL_PAGE_THRESHOLD:
+        return [
+            emit_page_dsl(components, nets, net_page_map)
+            for components, nets in pages
+        ]
+
+    max_workers = min(len(pages), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(emit_page_dsl, components, nets, net_page_map)
+            for components, nets in pages
+        ]
+        return [future.result() for future in futures]
 
 
 def emit_context_dsl(
@@ -126,43 +326,47 @@ def emit_context_dsl(
     sorted_neighbors = sorted(neighbor_components, key=lambda c: c.refdes)
     sorted_nets = sorted(nets, key=lambda n: n.name)
 
-    # Build output
+    # Build output through a single StringIO buffer
     primary_refdes = ", ".join(c.refdes for c in sorted_primary)
-    lines = [f"# CONTEXT: {primary_refdes}", ""]
+    buf = io.StringIO()
+    write = buf.write
+    write(f"# CONTEXT: {primary_refdes}\n\n")
 
     # COMPONENTS section - primary components only
-    lines.append("# COMPONENTS")
+    write("# COMPONENTS\n")
     for comp in sorted_primary:
         if comp.is_complex():
-            block = _format_component_block(comp)
-            lines.append(block)
+            _format_component_block(comp, write)
         else:
             # Simple primary components still get listed (but inline in nets)
             pass
 
-    lines.append("")
+    write("\n")
 
     # CONTEXT_NEIGHBORS section - simplified summaries
     if sorted_neighbors:
-        lines.append("# CONTEXT_NEIGHBORS")
+        write("# CONTEXT_NEIGHBORS\n")
         for comp in sorted_neighbors:
             # Format: U2 (LM358) - Dual Op-Amp
-            summary = _format_neighbor_summary(comp)
-            lines.append(summary)
-        lines.append("")
+            write(_format_neighbor_summary(comp))
+            write("\n")
+        write("\n")
 
     # NETS section
-    lines.append("# NETS")
+    write("# NETS\n")
     all_components = sorted_primary + sorted_neighbors
+    pin_index = {
+        c.refdes: c.pin_by_designator() for c in all_components
+    }
     for net in sorted_nets:
         # For context, we don't have full net_page_map, so just use net.pages
-        block = _format_net_block(net, net.pages, all_components)
-        lines.append(block)
+        _format_net_block(net, net.pages, pin_index, write)
 
-    return "\n".join(lines)
+    # Drop the final line terminator to match the historical join() output
+    return buf.getvalue()[:-1]
 
 
-def _format_component_block(component: Component) -> str:
+def _format_component_block(component: Component, write: Callable[[str], None]) -> None:
     """
     Format a complex component as a DEF block.
 
@@ -177,49 +381,46 @@ def _format_component_block(component: Component) -> str:
 
     Args:
         component: Component to format
-
-    Returns:
-        Formatted component block as multi-line string
+        write: Sink for newline-terminated output lines
     """
-    lines = []
-
-    # DEF line
+    # Header lines (DEF, COMP, optional MPN/FP) accumulate into one
+    # string so the block costs a single write dispatch instead of four
     comp_type = component.derived_type()
     if component.description:
-        lines.append(f"DEF {comp_type} {component.description}")
+        header = f"DEF {comp_type} {component.description}\n"
     else:
-        lines.append(f"DEF {comp_type}")
+        header = f"DEF {comp_type}\n"
 
-    # COMP line
-    lines.append(f"COMP {component.refdes} ({component.value})")
+    header += f"COMP {component.refdes} ({component.value})\n"
 
-    # MPN line (omit if empty)
+    # MPN / FP lines (omit if empty)
     if component.mpn:
-        lines.append(f"  MPN: {component.mpn}")
-
-    # FP line (omit if empty)
+        header += f"  MPN: {component.mpn}\n"
     if component.footprint:
-        lines.append(f"  FP: {component.footprint}")
+        header += f"  FP: {component.footprint}\n"
+    write(header)
 
     # PINS section
     if component.pins:
-        lines.append("  PINS:")
-        # Sort pins alphabetically by designator (natural sort for numbers)
-        sorted_pins = sorted(component.pins, key=lambda p: _natural_sort_key(p.designator))
-        for pin in sorted_pins:
-            if pin.name:
-                lines.append(f"    {pin.designator}: {pin.name}")
+        write("  PINS:\n")
+        # Extract the two emitted fields into flat tuples up front, then
+        # sort pins by designator (natural sort for numbers); the loop
+        # walks compact string pairs instead of chasing Pin objects
+        pin_rows = [(p.designator, p.name) for p in component.pins]
+        pin_rows.sort(key=lambda row: _natural_sort_key(row[0]))
+        for designator, name in pin_rows:
+            if name:
+                write(f"    {designator}: {name}\n")
             else:
-                lines.append(f"    {pin.designator}:")
-
-    return "\n".join(lines)
+                write(f"    {designator}:\n")
 
 
 def _format_net_block(
     net: Net,
     net_pages: Set[str],
-    components: List[Component]
-) -> str:
+    pin_index: Dict[str, Dict[str, Pin]],
+    write: Callable[[str], None]
+) -> None:
     """
     Format a net block with connectivity information.
 
@@ -240,54 +441,69 @@ def _format_net_block(
     Args:
         net: Net to format
         net_pages: Set of pages where this net appears
-        components: List of components (for pin lookup)
-
-    Returns:
-        Formatted net block as multi-line string
+        pin_index: Mapping of refdes to {pin_designator: Pin}
+        write: Sink for newline-terminated output lines
     """
-    lines = []
+    # Evaluate derived properties and hot attributes once up front; they
+    # are reused across the LINKS and CON branches below
+    is_global = net.is_global()
+    members = net.members
 
     # NET line
-    lines.append(f"NET {net.name}")
+    write(f"NET {net.name}\n")
 
     # LINKS line (for inter-page or global nets)
-    is_global = net.is_global()
-    is_inter_page = len(net_pages) > 1
-
     if is_global:
-        lines.append("  LINKS: ALL_PAGES")
-    elif is_inter_page:
-        # Sort pages alphabetically
-        sorted_pages = sorted(net_pages)
-        pages_str = ", ".join(sorted_pages)
-        lines.append(f"  LINKS: {pages_str}")
-
-    # CON line - format pin references
-    pin_refs = []
-    for refdes, pin_designator in net.members:
-        pin_ref = _format_pin_reference(refdes, pin_designator, components)
-        pin_refs.append(pin_ref)
-
-    # Sort pin references alphabetically
-    pin_refs.sort()
-
-    # Truncate for global nets (show first 10 + count)
-    if is_global and len(pin_refs) > 10:
-        shown_refs = pin_refs[:10]
-        others_count = len(pin_refs) - 10
+        write("  LINKS: ALL_PAGES\n")
+    elif len(net_pages) > 1:
+        write(f"  LINKS: {_format_links(frozenset(net_pages))}\n")
+
+    # CON line - format pin references; the local binding turns the
+    # per-member global lookup into a LOAD_FAST inside the comprehension
+    fmt = _format_pin_reference
+    pin_refs = [
+        fmt(refdes, pin_designator, pin_index)
+        for refdes, pin_designator in members
+    ]
+
+    # Truncate for global nets (show first 10 + count). nsmallest picks
+    # the same leading entries a full sort would, in O(M log 10) instead
+    # of O(M log M) - the rest of the list is about to be discarded anyway
+    ref_count = len(pin_refs)
+    if is_global and ref_count > 10:
+        shown_refs = heapq.nsmallest(10, pin_refs)
+        others_count = ref_count - 10
         con_str = ", ".join(shown_refs) + f" (+ {others_count} others)"
     else:
+        # Sort pin references alphabetically
+        pin_refs.sort()
         con_str = ", ".join(pin_refs)
 
-    lines.append(f"  CON: {con_str}")
+    write(f"  CON: {con_str}\n")
 
-    return "\n".join(lines)
+
+@functools.lru_cache(maxsize=4096)
+def _format_links(pages: FrozenSet[str]) -> str:
+    """
+    Sort and join a net's page set for the LINKS line.
+
+    The same inter-page net is re-emitted on every page it touches, so
+    the sorted/joined string is cached on the (frozen) page set; page
+    collections are tiny, so freezing the key is cheap.
+
+    Args:
+        pages: Pages the net appears on
+
+    Returns:
+        Comma-separated, alphabetically sorted page list
+    """
+    return ", ".join(sorted(pages))
 
 
 def _format_pin_reference(
     refdes: str,
     pin_designator: str,
-    components: List[Component]
+    pin_index: Dict[str, Dict[str, Pin]]
 ) -> str:
     """
     Format a pin reference for inclusion in a net connection list.
@@ -299,36 +515,22 @@ def _format_pin_reference(
     Args:
         refdes: Component reference designator
         pin_designator: Pin number/identifier
-        components: List of components to lookup pin details
+        pin_index: Mapping of refdes to {pin_designator: Pin}
 
     Returns:
         Formatted pin reference string
     """
-    # Find the component
-    component = None
-    for comp in components:
-        if comp.refdes == refdes:
-            component = comp
-            break
-
-    # If component not found or is simple, just return refdes.pin
-    if not component:
-        return f"{refdes}.{pin_designator}"
-
-    # Find the pin
-    pin = None
-    for p in component.pins:
-        if p.designator == pin_designator:
-            pin = p
-            break
+    # Single dict probe covers both the unknown-component and unknown-pin
+    # cases; pin_index carries an entry for every indexed component
+    pins = pin_index.get(refdes)
+    pin = pins.get(pin_designator) if pins is not None else None
 
     # If pin not found or has no name, simple format
     if not pin or not pin.name:
         return f"{refdes}.{pin_designator}"
 
     # Check if pin name is "simple" (just numeric or A/K)
-    simple_names = {"1", "2", "3", "4", "A", "K"}
-    if pin.name in simple_names:
+    if pin.name in _SIMPLE_PIN_NAMES:
         return f"{refdes}.{pin_designator}"
 
     # Complex pin with semantic name - include it in parentheses
@@ -353,11 +555,15 @@ def _format_neighbor_summary(component: Component) -> str:
         return f"{component.refdes} ({component.value})"
 
 
+@functools.lru_cache(maxsize=4096)
 def _natural_sort_key(text: str) -> Tuple:
     """
     Generate a sort key for natural sorting (e.g., "1", "2", "10" instead of "1", "10", "2").
 
     This is used for sorting pin designators that may contain numbers.
+    Designators repeat heavily across components ("1".."100", "PA0"..),
+    so the keys are LRU-cached and the split pattern is precompiled at
+    module load.
 
     Args:
         text: Text to generate sort key for
@@ -365,9 +571,7 @@ def _natural_sort_key(text: str) -> Tuple:
     Returns:
         Tuple that can be used for sorting
     """
-    import re
-
-    def atoi(text):
-        return int(text) if text.isdigit() else text
-
-    return tuple(atoi(c) for c in re.split(r'(\d+)', text))
+    return tuple(
+        int(part) if part.isdigit() else part
+        for part in _NAT_SORT_RE.split(text)
+    )
@@ -12,7 +12,10 @@ Key Responsibilities:
 - 1-hop traversal for context bubbles
 """
 
-from typing import List, Dict, Set, Optional
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Set, Optional, Tuple
 
 try:
     from .interfaces import SchematicProvider
@@ -24,6 +27,30 @@ except ImportError:
     import dsl_emitter
 
 
+# Ground-style names within the global class; matched once per net at
+# refresh rather than with two substring scans per get_index call
+_GND_RE = re.compile(r'GND|VSS', re.IGNORECASE)
+
+
+def _format_inter_page_line(net: Net, is_global: bool, is_ground: bool) -> str:
+    """
+    Format one entry of the index's Inter-Page Signals section.
+
+    Args:
+        net: Inter-page net to describe
+        is_global: Whether the net was classified global at refresh
+        is_ground: Whether the net was classified ground at refresh
+
+    Returns:
+        Formatted "- <name>: <pages>" line
+    """
+    if is_global:
+        if is_ground:
+            return f"- {net.name}: ALL_PAGES (Ground)"
+        return f"- {net.name}: ALL_PAGES (Power Rail)"
+    return f"- {net.name}: {' ↔ '.join(sorted(net.pages))}"
+
+
 class Librarian:
     """
     Central state manager and navigation layer for schematic data.
@@ -43,6 +70,27 @@ class Librarian:
         net_page_map: The Atlas - maps net names to sets of page names
     """
 
+    # Slot layout: attribute reads skip the per-instance dict, matching
+    # the slotted model dataclasses the hot paths iterate over
+    __slots__ = (
+        "provider",
+        "dirty",
+        "components",
+        "nets",
+        "net_page_map",
+        "_page_component_counts",
+        "_page_net_counts",
+        "_components_by_page",
+        "_all_pages",
+        "_components_by_refdes",
+        "_nets_by_name",
+        "_nets_by_refdes",
+        "_passive_refdes",
+        "_inter_page_nets_sorted",
+        "_global_net_names",
+        "_ground_net_names",
+    )
+
     def __init__(self, provider: SchematicProvider):
         """
         Initialize the Librarian with a data provider.
@@ -55,6 +103,19 @@ class Librarian:
         self.components: List[Component] = []
         self.nets: List[Net] = []
         self.net_page_map: Dict[str, Set[str]] = {}  # The Atlas
+        # Derived page views rebuilt by refresh(); queries read these
+        # instead of rescanning the component/net lists on every call
+        self._page_component_counts: Dict[str, int] = {}
+        self._page_net_counts: Dict[str, int] = {}
+        self._components_by_page: Dict[str, List[Component]] = {}
+        self._all_pages: Tuple[str, ...] = ()
+        self._components_by_refdes: Dict[str, Component] = {}
+        self._nets_by_name: Dict[str, Net] = {}
+        self._nets_by_refdes: Dict[str, List[Tuple[int, Net]]] = {}
+        self._passive_refdes: Set[str] = set()
+        self._inter_page_nets_sorted: List[Net] = []
+        self._global_net_names: Set[str] = set()
+        self._ground_net_names: Set[str] = set()
 
     def refresh(self) -> None:
         """
@@ -79,13 +140,93 @@ class Librarian:
         # Fetch fresh data from provider
         self.provider.fetch_raw_data()
         self.components = self.provider.get_components()
-        self.nets = self.provider.get_nets()
+
+        # Overlap: none of the component-side views below need the nets,
+        # and get_nets can do real work (net bucketing, and I/O in some
+        # providers, which releases the GIL), so it runs in a worker
+        # thread while this thread derives the component views.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            nets_future = executor.submit(self.provider.get_nets)
+
+            # Derived component views, computed once per refresh. These
+            # only change when the dirty flag flips, so queries like
+            # get_index and get_page read them directly instead of
+            # re-deriving per call. Counter consumes the generator in C,
+            # replacing per-element hash-lookup-and-add bytecode.
+            components_by_page: Dict[str, List[Component]] = {}
+            for comp in self.components:
+                components_by_page.setdefault(comp.page, []).append(comp)
+
+            self._page_component_counts = Counter(
+                comp.page for comp in self.components
+            )
+            self._components_by_page = components_by_page
+
+            # Identity index: get_component becomes an O(1) lookup
+            self._components_by_refdes = {
+                c.refdes: c for c in self.components
+            }
+
+            # Classification cache: is_passive re-derives the refdes
+            # prefix on every call, but the answer is fixed until the
+            # next refresh
+            self._passive_refdes = {
+                c.refdes for c in self.components if c.is_passive()
+            }
+
+            self.nets = nets_future.result()
 
         # Build the Atlas - map each net name to its set of pages
         self.net_page_map = {}
         for net in self.nets:
             self.net_page_map[net.name] = net.pages
 
+        self._page_net_counts = Counter(
+            page for net in self.nets for page in net.pages
+        )
+
+        # Every page seen on a component or a net, pre-sorted; queries
+        # return or measure this tuple instead of re-deriving the union
+        self._all_pages = tuple(sorted(
+            self._page_component_counts.keys() | self._page_net_counts.keys()
+        ))
+
+        # Identity index: get_net becomes an O(1) lookup
+        self._nets_by_name = {n.name: n for n in self.nets}
+
+        # Inverted connectivity index: refdes -> [(net position, Net)].
+        # get_page and get_context union a handful of per-refdes lists
+        # instead of scanning every net's members; the stored positions
+        # restore self.nets order afterwards.
+        nets_by_refdes: Dict[str, List[Tuple[int, Net]]] = {}
+        for pos, net in enumerate(self.nets):
+            seen_refdes: Set[str] = set()
+            for refdes, _pin in net.members:
+                if refdes not in seen_refdes:
+                    seen_refdes.add(refdes)
+                    nets_by_refdes.setdefault(refdes, []).append((pos, net))
+        self._nets_by_refdes = nets_by_refdes
+
+        # One pass over the nets covers both predicates; is_inter_page is
+        # a length check on pages that is_global's page test subsumes.
+        # The inter-page list is stored pre-sorted by name, which is the
+        # order get_index emits it in.
+        inter_page_nets: List[Net] = []
+        global_net_names: Set[str] = set()
+        ground_net_names: Set[str] = set()
+        gnd_search = _GND_RE.search
+        for net in self.nets:
+            if len(net.pages) > 1:
+                inter_page_nets.append(net)
+            if net.is_global():
+                global_net_names.add(net.name)
+                if gnd_search(net.name):
+                    ground_net_names.add(net.name)
+        inter_page_nets.sort(key=lambda n: n.name)
+        self._inter_page_nets_sorted = inter_page_nets
+        self._global_net_names = global_net_names
+        self._ground_net_names = ground_net_names
+
         self.dirty = False
 
     def get_index(self) -> str:
@@ -111,7 +252,10 @@ class Librarian:
             - UART_TX: Main_Sheet ↔ Connector_Page
             - GND: ALL_PAGES (Power Rail)
         """
-        self.refresh()
+        # Inlined guard: skip the refresh() call entirely on the hot
+        # clean path; the method call costs more than the check itself
+        if self.dirty:
+            self.refresh()
 
         # Handle empty schematic
         if not self.components and not self.nets:
@@ -119,59 +263,49 @@ class Librarian:
 
         lines = ["# SCHEMATIC INDEX", ""]
 
-        # Build page statistics
-        # Group components by page
-        page_component_counts: Dict[str, int] = {}
-        for comp in self.components:
-            page_component_counts[comp.page] = page_component_counts.get(comp.page, 0) + 1
-
-        # Group nets by page (count nets that appear on each page)
-        page_net_counts: Dict[str, int] = {}
-        for net in self.nets:
-            for page in net.pages:
-                page_net_counts[page] = page_net_counts.get(page, 0) + 1
-
-        # Get all unique pages (from both components and nets)
-        all_pages = set(page_component_counts.keys()) | set(page_net_counts.keys())
+        # Page statistics and the page list were derived once in refresh()
+        page_component_counts = self._page_component_counts
+        page_net_counts = self._page_net_counts
+        all_pages = self._all_pages
 
         # Pages section
         lines.append("## Pages")
         if not all_pages:
             lines.append("(No pages found)")
         else:
-            # Sort pages alphabetically
-            for page in sorted(all_pages):
-                comp_count = page_component_counts.get(page, 0)
-                net_count = page_net_counts.get(page, 0)
-                lines.append(f"- {page} ({comp_count} components, {net_count} nets)")
+            # Sorted alphabetically; one generator feeds extend instead of
+            # a per-line append dispatch
+            lines.extend(
+                f"- {page} ({page_component_counts.get(page, 0)} components,"
+                f" {page_net_counts.get(page, 0)} nets)"
+                for page in all_pages
+            )
 
         lines.append("")
 
         # Inter-page signals section
         lines.append("## Inter-Page Signals")
 
-        # Find all inter-page nets
-        inter_page_nets = [net for net in self.nets if net.is_inter_page()]
+        # Inter-page nets were collected and name-sorted once in refresh
+        inter_page_nets = self._inter_page_nets_sorted
 
         if not inter_page_nets:
             lines.append("(No inter-page signals)")
         else:
-            # Sort by net name
-            inter_page_nets.sort(key=lambda n: n.name)
-
-            for net in inter_page_nets:
-                if net.is_global():
-                    # Global nets show as ALL_PAGES
-                    # Classify as Power Rail or Ground based on name
-                    if 'GND' in net.name.upper() or 'VSS' in net.name.upper():
-                        lines.append(f"- {net.name}: ALL_PAGES (Ground)")
-                    else:
-                        lines.append(f"- {net.name}: ALL_PAGES (Power Rail)")
-                else:
-                    # Regular inter-page nets show page connections
-                    pages = sorted(net.pages)
-                    pages_str = " ↔ ".join(pages)
-                    lines.append(f"- {net.name}: {pages_str}")
+            # Global nets show as ALL_PAGES, classified as Power Rail or
+            # Ground by name; regular inter-page nets list their pages.
+            # A single generator feeds extend, avoiding a method dispatch
+            # per emitted line.
+            global_net_names = self._global_net_names
+            ground_net_names = self._ground_net_names
+            lines.extend(
+                _format_inter_page_line(
+                    net,
+                    net.name in global_net_names,
+                    net.name in ground_net_names,
+                )
+                for net in inter_page_nets
+            )
 
         return "\n".join(lines)
 
@@ -190,10 +324,13 @@ class Librarian:
             - Only includes nets that have at least one connection on this page
             - Uses dsl_emitter.emit_page_dsl() for actual formatting
         """
-        self.refresh()
+        # Inlined guard: skip the refresh() call entirely on the hot
+        # clean path; the method call costs more than the check itself
+        if self.dirty:
+            self.refresh()
 
-        # Filter components for this page
-        page_components = [c for c in self.components if c.page == page_name]
+        # Components for this page, from the view derived in refresh()
+        page_components = self._components_by_page.get(page_name, [])
 
         # Check if page exists
         if not page_components:
@@ -208,15 +345,7 @@ class Librarian:
         # Filter nets to include only those with pins on this page
         # A net appears on this page if any of its member components are on this page
         page_component_refdes = {c.refdes for c in page_components}
-        page_nets = []
-        for net in self.nets:
-            # Check if any net member is on this page
-            has_connection_on_page = any(
-                refdes in page_component_refdes
-                for refdes, pin_designator in net.members
-            )
-            if has_connection_on_page:
-                page_nets.append(net)
+        page_nets = self._connected_nets(page_component_refdes)
 
         # Use DSL emitter to format the page
         return dsl_emitter.emit_page_dsl(page_components, page_nets, self.net_page_map)
@@ -251,7 +380,10 @@ class Librarian:
             # NETS
             <net blocks showing connectivity>
         """
-        self.refresh()
+        # Inlined guard: skip the refresh() call entirely on the hot
+        # clean path; the method call costs more than the check itself
+        if self.dirty:
+            self.refresh()
 
         # Handle empty input
         if not refdes_list:
@@ -267,16 +399,7 @@ class Librarian:
 
         # Step 2: Find all nets connected to primary components
         primary_refdes_set = {c.refdes for c in primary_components}
-        connected_nets = []
-
-        for net in self.nets:
-            # Check if any member of this net is a primary component
-            has_primary = any(
-                refdes in primary_refdes_set
-                for refdes, pin_designator in net.members
-            )
-            if has_primary:
-                connected_nets.append(net)
+        connected_nets = self._connected_nets(primary_refdes_set)
 
         # Step 3: Find all neighbor components on those nets
         neighbor_refdes_set = set()
@@ -287,44 +410,62 @@ class Librarian:
                 if refdes not in primary_refdes_set:
                     neighbor_refdes_set.add(refdes)
 
-        # Get full neighbor component objects
-        all_neighbors = [c for c in self.components if c.refdes in neighbor_refdes_set]
+        # Get full neighbor component objects through the refdes index;
+        # sorted for determinism (the emitter re-sorts by refdes anyway).
+        # Nets can reference components absent from the schematic, hence
+        # the membership filter.
+        components_by_refdes = self._components_by_refdes
+        all_neighbors = [
+            components_by_refdes[refdes]
+            for refdes in sorted(neighbor_refdes_set)
+            if refdes in components_by_refdes
+        ]
 
         # Step 4: Classify neighbors - only active (non-passive) go in CONTEXT_NEIGHBORS
         # Passive components will appear inline in NET lines only
-        neighbor_components = [c for c in all_neighbors if not c.is_passive()]
-
-        # Step 5: Handle global nets
-        # For context DSL, we may want to filter global net members to only show
-        # connections relevant to the context (primary + neighbors)
-        context_refdes = primary_refdes_set | neighbor_refdes_set
-        context_nets = []
-
-        for net in connected_nets:
-            # Filter net members to only those in our context
-            filtered_members = [
-                (refdes, pin_designator)
-                for refdes, pin_designator in net.members
-                if refdes in context_refdes
-            ]
-
-            # Create a filtered version of the net for context
-            # We need to preserve the original net structure but with filtered members
-            # Create a new Net object with filtered data
-            context_net = Net(
-                name=net.name,
-                pages=net.pages,
-                members=filtered_members
-            )
-            context_nets.append(context_net)
-
-        # Use DSL emitter to format the context
+        passive_refdes = self._passive_refdes
+        neighbor_components = [
+            c for c in all_neighbors if c.refdes not in passive_refdes
+        ]
+
+        # Step 5: Hand the connected nets to the emitter as-is. The old
+        # member filter against primary + neighbors kept every entry by
+        # construction - any member of a connected net is either primary
+        # or was just added to the neighbor set in Step 3 - so the
+        # per-net copies carried identical data, and the emitter only
+        # reads the nets it is given.
         return dsl_emitter.emit_context_dsl(
             primary_components,
             neighbor_components,
-            context_nets
+            connected_nets
         )
 
+    def _connected_nets(self, refdes_set: Set[str]) -> List[Net]:
+        """
+        Collect the nets touching any refdes in the given set.
+
+        Unions the per-refdes lists from the inverted index built in
+        refresh(), so the cost scales with the matching nets rather than
+        with every member of every net in the design.
+
+        Args:
+            refdes_set: Reference designators to look up
+
+        Returns:
+            Matching nets, deduplicated, in self.nets order
+        """
+        seen: Set[int] = set()
+        hits: List[Tuple[int, Net]] = []
+        index = self._nets_by_refdes
+        for refdes in refdes_set:
+            for entry in index.get(refdes, ()):
+                pos = entry[0]
+                if pos not in seen:
+                    seen.add(pos)
+                    hits.append(entry)
+        hits.sort(key=lambda entry: entry[0])
+        return [net for _pos, net in hits]
+
     def mark_dirty(self) -> None:
         """
         Mark the cached data as dirty, forcing refresh on next query.
@@ -345,19 +486,12 @@ class Librarian:
             This is a helper method for external tools that need to
             enumerate available pages.
         """
-        self.refresh()
-
-        pages = set()
+        # Inlined guard: skip the refresh() call entirely on the hot
+        # clean path; the method call costs more than the check itself
+        if self.dirty:
+            self.refresh()
 
-        # Get pages from components
-        for comp in self.components:
-            pages.add(comp.page)
-
-        # Get pages from nets
-        for net in self.nets:
-            pages.update(net.pages)
-
-        return sorted(pages)
+        return list(self._all_pages)
 
     def get_component(self, refdes: str) -> Optional[Component]:
         """
@@ -373,13 +507,12 @@ class Librarian:
             This is a helper method for external tools that need to
             query individual components.
         """
-        self.refresh()
+        # Inlined guard: skip the refresh() call entirely on the hot
+        # clean path; the method call costs more than the check itself
+        if self.dirty:
+            self.refresh()
 
-        for comp in self.components:
-            if comp.refdes == refdes:
-                return comp
-
-        return None
+        return self._components_by_refdes.get(refdes)
 
     def get_net(self, net_name: str) -> Optional[Net]:
         """
@@ -395,13 +528,12 @@ class Librarian:
             This is a helper method for external tools that need to
             query individual nets.
         """
-        self.refresh()
-
-        for net in self.nets:
-            if net.name == net_name:
-                return net
+        # Inlined guard: skip the refresh() call entirely on the hot
+        # clean path; the method call costs more than the check itself
+        if self.dirty:
+            self.refresh()
 
-        return None
+        return self._nets_by_name.get(net_name)
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -418,14 +550,17 @@ class Librarian:
         Notes:
             Useful for debugging and reporting.
         """
-        self.refresh()
+        # Inlined guard: skip the refresh() call entirely on the hot
+        # clean path; the method call costs more than the check itself
+        if self.dirty:
+            self.refresh()
 
         stats = {
             'total_components': len(self.components),
             'total_nets': len(self.nets),
-            'total_pages': len(self.get_all_pages()),
-            'inter_page_nets': sum(1 for net in self.nets if net.is_inter_page()),
-            'global_nets': sum(1 for net in self.nets if net.is_global()),
+            'total_pages': len(self._all_pages),
+            'inter_page_nets': len(self._inter_page_nets_sorted),
+            'global_nets': len(self._global_net_names),
         }
 
         return stats
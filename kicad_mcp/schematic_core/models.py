@@ -7,15 +7,99 @@ the schematic core library and are used by all provider adapters.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Set, Tuple, Dict, Optional
-import re
+from typing import Collection, List, Sequence, Tuple, Dict, Optional
 
 
-@dataclass
+# Power/ground net tokens recognized by Net.is_global, either as the
+# whole name (GND, VBAT) or as the first/last underscore-separated
+# segment (VCC_DIGITAL, ANALOG_GND). Almost every name checked is one
+# of these exact tokens, so a couple of frozenset probes replace the
+# regex machinery entirely.
+_POWER_EXACT = frozenset({'GND', 'PGND', 'VSS', 'VCC', 'VDD', 'VEE', 'VBAT'})
+
+# The handful of names that cover the vast majority of real power-net
+# classifications, probed first so typical calls resolve in a single
+# set lookup without touching the segment splits or the rail scanner.
+# Includes the analog/digital ground spellings and the common rail
+# shorthands alongside the exact power tokens.
+_COMMON_POWER = _POWER_EXACT | frozenset({
+    'AGND', 'DGND',
+    '3V3', '+3V3', '+3.3V', '1V8', '+1V8',
+    '5V', '+5V', '12V', '+12V', '-12V',
+})
+
+# Pin names with no semantic content ("1".."4", anode/cathode letters,
+# unnamed); anything else marks a component as complex. Hoisted to a
+# module-level frozenset so is_complex does not rebuild a set per call.
+_SIMPLE_PIN_NAMES = frozenset({'1', '2', '3', '4', 'A', 'K', ''})
+
+# Derived types counted as passive by is_passive.
+_PASSIVE_TYPES = frozenset({'RES', 'CAP', 'IND', 'FUSE'})
+
+# Refdes-prefix -> component-type mapping from spec section 3.2, as a
+# single hashed lookup instead of a linear if/elif chain. Prefixes not
+# listed classify as ACTIVE.
+_PREFIX_TO_TYPE = {
+    'R': 'RES',
+    'C': 'CAP',
+    'L': 'IND',
+    'FB': 'IND',
+    'F': 'FUSE',
+    'D': 'DIODE',
+    'LED': 'DIODE',
+    'Q': 'TRANSISTOR',
+    'U': 'IC',
+    'J': 'CONN',
+    'P': 'CONN',
+    'CN': 'CONN',
+    'CONN': 'CONN',
+    'SW': 'SWITCH',
+    'X': 'OSC',
+    'Y': 'OSC',
+}
+
+
+def _is_voltage_rail(name: str) -> bool:
+    """
+    Return True if an upper-cased net name starts with a voltage-rail
+    spelling like 3V3, 3.3V, +5V, 12V, or 1V8.
+
+    Hand-rolled character scan equivalent to the prefix regex
+    ``\\+?(\\d+(\\.\\d*)?V\\d*|\\d*(\\.\\d*)?V\\d+)``: an optional ``+``,
+    digits with an optional fractional part, a ``V``, and optional
+    trailing digits -- with at least one digit on one side of the ``V``.
+    """
+    i = 0
+    n = len(name)
+    if i < n and name[i] == '+':
+        i += 1
+    start = i
+    while i < n and name[i].isdigit():
+        i += 1
+    digits_before = i > start
+    if i < n and name[i] == '.':
+        i += 1
+        while i < n and name[i].isdigit():
+            i += 1
+    if i >= n or name[i] != 'V':
+        return False
+    i += 1
+    start = i
+    while i < n and name[i].isdigit():
+        i += 1
+    return digits_before or i > start
+
+
+@dataclass(frozen=True, slots=True)
 class Pin:
     """
     Represents a single pin on a component.
 
+    Declared with slots: designs routinely carry tens of thousands of Pin
+    instances, and slot storage roughly halves per-instance memory while
+    speeding attribute access. Frozen as well, so pins are hashable and
+    can be shared, cached, or collected into sets freely.
+
     Attributes:
         designator: Pin number or identifier (e.g., "1", "22", "A1")
         name: Semantic pin name (e.g., "VCC", "PA9_TX", "" for unnamed pins)
@@ -26,7 +110,7 @@ class Pin:
     net: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     """
     Represents an electronic component in the schematic.
@@ -54,15 +138,75 @@ class Component:
     location: tuple
     properties: Dict[str, str]
     multipart_parent: Optional[str] = None
+    # Memoized pin lookup table; built lazily by pin_by_designator().
+    # Stored as a field rather than an external cache so slotted
+    # instances can hold it without a __dict__.
+    _pin_map: Optional[Dict[str, Pin]] = field(
+        default=None, repr=False, compare=False
+    )
+    # Memoized classification results; derived_type() and is_complex()
+    # are pure functions of refdes and pins, which never change after
+    # construction, and both are re-evaluated per component several
+    # times per emission.
+    # Lazily-materialized column view of pin names; name-only scans
+    # (is_complex) walk this flat tuple instead of chasing one Pin
+    # object per entry.
+    _pin_names: Optional[Tuple[str, ...]] = field(
+        default=None, repr=False, compare=False
+    )
+    _derived_type: Optional[str] = field(
+        default=None, repr=False, compare=False
+    )
+    _is_complex: Optional[bool] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def pin_by_designator(self) -> Dict[str, Pin]:
+        """
+        Return a designator -> Pin lookup table for this component.
+
+        Built once on first call and reused afterwards, turning repeated
+        pin lookups (the DSL emitter resolves one per net member) into
+        O(1) dict probes. Pins are not expected to change after
+        construction; callers must not mutate the returned dict.
+
+        Returns:
+            Dict mapping pin designator to Pin
+        """
+        if self._pin_map is None:
+            self._pin_map = {p.designator: p for p in self.pins}
+        return self._pin_map
+
+    def pin_names(self) -> Tuple[str, ...]:
+        """
+        Return the pin names as a flat tuple, in pin order.
+
+        Built once on first call and reused afterwards. This is a
+        struct-of-arrays view over the pins list: scans that only need
+        the name column (is_complex) walk one contiguous tuple of
+        strings rather than dereferencing a Pin object per entry.
+
+        Returns:
+            Tuple of pin names, parallel to self.pins
+        """
+        if self._pin_names is None:
+            self._pin_names = tuple(p.name for p in self.pins)
+        return self._pin_names
 
     def derived_type(self) -> str:
         """
         Map reference designator prefix to standard component type category.
 
+        Computed once and cached on the instance; the refdes is not
+        expected to change after construction.
+
         Returns:
             Component type string (RES, CAP, IND, FUSE, DIODE, TRANSISTOR,
             IC, CONN, SWITCH, OSC, or ACTIVE)
         """
+        if self._derived_type is not None:
+            return self._derived_type
+
         # Extract prefix from refdes (e.g., "U" from "U1", "FB" from "FB3")
         # Handle multi-part components (e.g., "U1A" -> "U")
         prefix = ""
@@ -72,31 +216,9 @@ class Component:
             else:
                 break
 
-        prefix_upper = prefix.upper()
-
-        # Type mapping table from spec section 3.2
-        if prefix_upper == "R":
-            return "RES"
-        elif prefix_upper == "C":
-            return "CAP"
-        elif prefix_upper in ("L", "FB"):
-            return "IND"
-        elif prefix_upper == "F":
-            return "FUSE"
-        elif prefix_upper in ("D", "LED"):
-            return "DIODE"
-        elif prefix_upper == "Q":
-            return "TRANSISTOR"
-        elif prefix_upper == "U":
-            return "IC"
-        elif prefix_upper in ("J", "P", "CN", "CONN"):
-            return "CONN"
-        elif prefix_upper == "SW":
-            return "SWITCH"
-        elif prefix_upper in ("X", "Y"):
-            return "OSC"
-        else:
-            return "ACTIVE"
+        derived = _PREFIX_TO_TYPE.get(prefix.upper(), 'ACTIVE')
+        self._derived_type = derived
+        return derived
 
     def is_complex(self) -> bool:
         """
@@ -106,21 +228,22 @@ class Component:
         if any pin has a semantic name (not just simple numeric or
         single-letter designators like "1", "2", "A", "K").
 
+        Computed once and cached on the instance; pins are not expected
+        to change after construction.
+
         Returns:
             True if component is complex and needs expanded DSL format,
             False if it's simple and can be inline in net definitions
         """
-        # Complex if more than 4 pins
-        if len(self.pins) > 4:
-            return True
-
-        # Check if any pin has semantic name (not just "1", "2", "3", "4", "A", "K")
-        simple_names = {"1", "2", "3", "4", "A", "K", ""}
-        for pin in self.pins:
-            if pin.name and pin.name not in simple_names:
-                return True
-
-        return False
+        if self._is_complex is None:
+            # More than 4 pins, or any pin with a semantic name (not just
+            # "1".."4", "A", "K"). The length test runs first and any()
+            # stops at the first semantic name.
+            names = self.pin_names()
+            self._is_complex = len(names) > 4 or any(
+                name and name not in _SIMPLE_PIN_NAMES for name in names
+            )
+        return self._is_complex
 
     def is_passive(self) -> bool:
         """
@@ -129,24 +252,26 @@ class Component:
         Returns:
             True if component type is RES, CAP, IND, or FUSE
         """
-        passive_types = {"RES", "CAP", "IND", "FUSE"}
-        return self.derived_type() in passive_types
+        return self.derived_type() in _PASSIVE_TYPES
 
 
-@dataclass
+@dataclass(slots=True)
 class Net:
     """
     Represents a net (electrical connection) in the schematic.
 
     Attributes:
         name: Net name (e.g., "UART_TX", "GND", "Net_U1_5")
-        pages: Set of page names where this net appears
-        members: List of (component_refdes, pin_designator) tuples
-                 representing all pins connected to this net
+        pages: Page names where this net appears. Only membership, length
+               and iteration are required, so adapters finalize this as a
+               small sorted tuple (most nets span 1-2 pages, and a tuple
+               is far smaller than a set); plain sets also work
+        members: (component_refdes, pin_designator) pairs representing all
+                 pins connected to this net; a list or a tuple
     """
     name: str
-    pages: Set[str] = field(default_factory=set)
-    members: List[Tuple[str, str]] = field(default_factory=list)
+    pages: Collection[str] = field(default_factory=tuple)
+    members: Sequence[Tuple[str, str]] = field(default_factory=list)
 
     def is_global(self) -> bool:
         """
@@ -158,14 +283,8 @@ class Net:
         Returns:
             True if net should be summarized in DSL output
         """
-        # Check power/ground net naming patterns
-        # Pattern matches: GND, PGND, VSS, VCC, VDD, VEE, VBAT,
-        # voltage rails like 3V3, 3.3V, +5V, 12V, 1V8, etc.
-        # and domain-specific like NET_GND, SIGNAL_VCC, VCC_DIGITAL
-        power_pattern = r'^(P?GND|VSS|VCC|VDD|VEE|VBAT)($|_.*)|^(\+?(\d+\.?\d*V\d*|\d*\.?\d*V\d+)|\+?(\d+V))|^.*_(GND|VCC|VDD)$'
-        if re.match(power_pattern, self.name, re.IGNORECASE):
-            return True
-
+        # Cheap integer comparisons run first so heavily-connected or
+        # widely-spanning nets never reach the regex at all.
         # More than 15 connections
         if len(self.members) > 15:
             return True
@@ -174,7 +293,18 @@ class Net:
         if len(self.pages) > 3:
             return True
 
-        return False
+        # Power/ground naming: uppercase once, then hashed set probes on
+        # the whole name and its first/last underscore segments, with the
+        # voltage-rail character scan as the final fallback.
+        name = self.name.upper()
+        if name in _COMMON_POWER:
+            return True
+        if '_' in name:
+            if name.split('_', 1)[0] in _POWER_EXACT:
+                return True
+            if name.rsplit('_', 1)[-1] in _POWER_EXACT:
+                return True
+        return _is_voltage_rail(name)
 
     def is_inter_page(self) -> bool:
         """
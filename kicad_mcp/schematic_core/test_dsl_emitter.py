@@ -302,16 +302,20 @@ def test_context_dsl():
     # Create context around U1
     primary = [c for c in components if c.refdes == "U1"]
 
-    # Find neighbors (components connected via nets to U1)
+    # Find neighbors (components connected via nets to U1) through an
+    # inverted net-name index, so the walk touches only U1's nets
+    # instead of re-testing membership for every member of every net
     u1_nets = set()
     for pin in primary[0].pins:
         u1_nets.add(pin.net)
 
-    neighbor_refdes = set()
-    for net in nets:
-        for refdes, pin_designator in net.members:
-            if net.name in u1_nets and refdes != "U1":
-                neighbor_refdes.add(refdes)
+    net_by_name = {n.name: n for n in nets}
+    neighbor_refdes = {
+        refdes
+        for name in u1_nets if name in net_by_name
+        for refdes, _pin in net_by_name[name].members
+        if refdes != "U1"
+    }
 
     neighbors = [c for c in components if c.refdes in neighbor_refdes]
 
@@ -230,8 +230,11 @@ def test_adapter_transform(mock_adapter):
     assert all(isinstance(c, Component) for c in components)
     print(f"[OK] All components are Component instances")
 
+    # Index once, query many: O(components) instead of a scan per lookup
+    by_refdes = {c.refdes: c for c in components}
+
     # Check first component U1
-    u1 = next((c for c in components if c.refdes == "U1"), None)
+    u1 = by_refdes.get("U1")
     assert u1 is not None
     assert u1.value == "LTC7003EMSE#TRPBF"
     assert u1.page == "Power_Switches.SchDoc"
@@ -247,8 +250,10 @@ def test_adapter_transform(mock_adapter):
     assert all(isinstance(n, Net) for n in nets)
     print(f"[OK] All nets are Net instances")
 
+    by_name = {n.name: n for n in nets}
+
     # Check GND net (should be present and global)
-    gnd_net = next((n for n in nets if n.name == "GND"), None)
+    gnd_net = by_name.get("GND")
     assert gnd_net is not None
     assert len(gnd_net.members) > 0
     print(f"[OK] GND net found with {len(gnd_net.members)} connections")
@@ -259,7 +264,7 @@ def test_adapter_transform(mock_adapter):
     print(f"[OK] GND correctly identified as global net")
 
     # Check a specific net connection
-    fuse_vout = next((n for n in nets if n.name == "FUSE_VOUT"), None)
+    fuse_vout = by_name.get("FUSE_VOUT")
     assert fuse_vout is not None
     print(f"[OK] FUSE_VOUT net found with {len(fuse_vout.members)} connections")
 
@@ -475,7 +480,8 @@ def test_multi_page_nets(mock_adapter):
             print(f"    - {net.name}: {len(net.members)} connections on {len(net.pages)} pages")
 
     # Verify GND is multi-page (should be)
-    gnd = next((n for n in nets if n.name == "GND"), None)
+    by_name = {n.name: n for n in nets}
+    gnd = by_name.get("GND")
     if gnd:
         assert gnd.is_inter_page() or gnd.is_global()
         print(f"\n[OK] GND is correctly identified as global/multi-page")
@@ -586,9 +592,10 @@ def test_context_bubble(mock_adapter):
             if pin.net:
                 primary_nets.add(pin.net)
 
+    by_name = {n.name: n for n in nets}
     neighbor_refdes = set()
     for net_name in primary_nets:
-        net = next((n for n in nets if n.name == net_name), None)
+        net = by_name.get(net_name)
         if net:
             for refdes, _ in net.members:
                 if refdes != primary_refdes:
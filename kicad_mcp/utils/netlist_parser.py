@@ -1,11 +1,47 @@
 """
 KiCad schematic netlist extraction utilities.
 """
+import logging
 import os
 import re
 from typing import Any, Dict, List
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
+
+def _find_expr_end(content: str, start: int) -> int:
+    """Find the end of the balanced S-expression starting at `start`.
+
+    Jumps between parentheses with str.find (a C-level scan) instead of
+    visiting every character from Python, and avoids the quadratic
+    per-character string accumulation the extractors used previously.
+
+    Args:
+        content: Text containing the S-expression
+        start: Index of the opening parenthesis (or of a match that begins
+            at the opening parenthesis)
+
+    Returns:
+        Index one past the closing parenthesis, or -1 if unbalanced
+    """
+    depth = 0
+    pos = start
+    find = content.find
+    while True:
+        close_pos = find(')', pos)
+        if close_pos == -1:
+            return -1
+        open_pos = find('(', pos, close_pos)
+        if open_pos != -1:
+            depth += 1
+            pos = open_pos + 1
+        else:
+            depth -= 1
+            pos = close_pos + 1
+            if depth == 0:
+                return pos
+
 class SchematicParser:
     """Parser for KiCad schematic files to extract netlist information."""
 
@@ -44,15 +80,15 @@ class SchematicParser:
     def _load_schematic(self) -> None:
         """Load the schematic file content."""
         if not os.path.exists(self.schematic_path):
-            print(f"Schematic file not found: {self.schematic_path}")
+            logger.error("Schematic file not found: %s", self.schematic_path)
             raise FileNotFoundError(f"Schematic file not found: {self.schematic_path}")
         
         try:
             with open(self.schematic_path, 'r') as f:
                 self.content = f.read()
-                print(f"Successfully loaded schematic: {self.schematic_path}")
+                logger.info("Successfully loaded schematic: %s", self.schematic_path)
         except Exception as e:
-            print(f"Error reading schematic file: {str(e)}")
+            logger.error("Error reading schematic file: %s", str(e))
             raise
 
     def parse(self) -> Dict[str, Any]:
@@ -63,57 +99,57 @@ class SchematicParser:
         """
         import time
         overall_start = time.time()
-        print(f"=" * 60)
-        print(f"Starting schematic parsing: {os.path.basename(self.schematic_path)}")
-        print(f"=" * 60)
+        logger.info("=" * 60)
+        logger.info("Starting schematic parsing: %s", os.path.basename(self.schematic_path))
+        logger.info("=" * 60)
 
         # Extract hierarchical sheets first
         if self.is_hierarchical:
             step_start = time.time()
             self._extract_sheets()
-            print(f"[Step 1/8] Extracted sheets in {time.time() - step_start:.2f}s")
+            logger.info("[Step 1/8] Extracted sheets in %.2fs", time.time() - step_start)
 
         # Extract symbols (components)
         step_start = time.time()
         self._extract_components()
-        print(f"[Step 2/8] Extracted components in {time.time() - step_start:.2f}s")
+        logger.info("[Step 2/8] Extracted components in %.2fs", time.time() - step_start)
 
         # Extract wires
         step_start = time.time()
         self._extract_wires()
-        print(f"[Step 3/8] Extracted wires in {time.time() - step_start:.2f}s")
+        logger.info("[Step 3/8] Extracted wires in %.2fs", time.time() - step_start)
 
         # Extract junctions
         step_start = time.time()
         self._extract_junctions()
-        print(f"[Step 4/8] Extracted junctions in {time.time() - step_start:.2f}s")
+        logger.info("[Step 4/8] Extracted junctions in %.2fs", time.time() - step_start)
 
         # Extract labels
         step_start = time.time()
         self._extract_labels()
-        print(f"[Step 5/8] Extracted labels in {time.time() - step_start:.2f}s")
+        logger.info("[Step 5/8] Extracted labels in %.2fs", time.time() - step_start)
 
         # Extract power symbols
         step_start = time.time()
         self._extract_power_symbols()
-        print(f"[Step 6/8] Extracted power symbols in {time.time() - step_start:.2f}s")
+        logger.info("[Step 6/8] Extracted power symbols in %.2fs", time.time() - step_start)
 
         # Extract no-connects
         step_start = time.time()
         self._extract_no_connects()
-        print(f"[Step 7/8] Extracted no-connects in {time.time() - step_start:.2f}s")
+        logger.info("[Step 7/8] Extracted no-connects in %.2fs", time.time() - step_start)
 
         # If this is a hierarchical schematic with sub-sheets, parse them too
         if self.is_hierarchical and self.sheets:
             step_start = time.time()
-            print(f"[Step 8/8] Found {len(self.sheets)} hierarchical sheets, parsing sub-schematics...")
+            logger.info("[Step 8/8] Found %s hierarchical sheets, parsing sub-schematics...", len(self.sheets))
             self._parse_hierarchical_sheets()
-            print(f"[Step 8/8] Completed hierarchical parsing in {time.time() - step_start:.2f}s")
+            logger.info("[Step 8/8] Completed hierarchical parsing in %.2fs", time.time() - step_start)
 
         # Build netlist
         step_start = time.time()
         self._build_netlist()
-        print(f"Built netlist in {time.time() - step_start:.2f}s")
+        logger.info("Built netlist in %.2fs", time.time() - step_start)
 
         # Create result
         result = {
@@ -129,10 +165,10 @@ class SchematicParser:
         }
 
         total_time = time.time() - overall_start
-        print(f"=" * 60)
-        print(f"Schematic parsing complete in {total_time:.2f}s")
-        print(f"Found {len(self.component_info)} components and {len(self.nets)} nets")
-        print(f"=" * 60)
+        logger.info("=" * 60)
+        logger.info("Schematic parsing complete in %.2fs", total_time)
+        logger.info("Found %s components and %s nets", len(self.component_info), len(self.nets))
+        logger.info("=" * 60)
         return result
 
     def _extract_s_expressions(self, pattern: str) -> List[str]:
@@ -144,62 +180,31 @@ class SchematicParser:
         Returns:
             List of matching S-expressions
         """
-        matches = []
-        positions = []
-        
-        # Find all starting positions of matches
-        for match in re.finditer(pattern, self.content):
-            positions.append(match.start())
-        
-        # Extract full S-expressions for each match
-        for pos in positions:
-            # Start from the matching position
-            current_pos = pos
-            depth = 0
-            s_exp = ""
-            
-            # Extract the full S-expression by tracking parentheses
-            while current_pos < len(self.content):
-                char = self.content[current_pos]
-                s_exp += char
-                
-                if char == '(':
-                    depth += 1
-                elif char == ')':
-                    depth -= 1
-                    if depth == 0:
-                        # Found the end of the S-expression
-                        break
-                
-                current_pos += 1
-            
-            matches.append(s_exp)
-        
-        return matches
+        return self._extract_s_expressions_from_content(pattern, self.content)
 
     def _extract_components(self) -> None:
         """Extract component information from schematic."""
         import time
-        print(f"Extracting components from {os.path.basename(self.schematic_path)}")
+        logger.info("Extracting components from %s", os.path.basename(self.schematic_path))
         start_time = time.time()
 
         # Find the lib_symbols section and remove it to avoid extracting symbol definitions
-        print("  Removing lib_symbols section...")
+        logger.info("  Removing lib_symbols section...")
         lib_start = time.time()
         content_without_lib_symbols = self._remove_lib_symbols_section()
-        print(f"  Removed lib_symbols in {time.time() - lib_start:.2f}s")
+        logger.info("  Removed lib_symbols in %.2fs", time.time() - lib_start)
 
         # Extract all symbol expressions (components) from the cleaned content
-        print("  Extracting symbol expressions...")
+        logger.info("  Extracting symbol expressions...")
         extract_start = time.time()
         symbols = self._extract_s_expressions_from_content(r'\(symbol\s+', content_without_lib_symbols)
-        print(f"  Found {len(symbols)} symbols in {time.time() - extract_start:.2f}s")
+        logger.info("  Found %s symbols in %.2fs", len(symbols), time.time() - extract_start)
 
-        print("  Parsing components...")
+        logger.info("  Parsing components...")
         parse_start = time.time()
         for idx, symbol in enumerate(symbols, 1):
             if idx % 50 == 0:
-                print(f"    Parsing component {idx}/{len(symbols)}...")
+                logger.debug("    Parsing component %s/%s...", idx, len(symbols))
             component = self._parse_component(symbol)
             if component:
                 self.components.append(component)
@@ -209,7 +214,7 @@ class SchematicParser:
                 self.component_info[ref] = component
 
         total_time = time.time() - start_time
-        print(f"Extracted {len(self.components)} components in {total_time:.2f}s")
+        logger.info("Extracted %s components in %.2fs", len(self.components), total_time)
 
     def _remove_lib_symbols_section(self) -> str:
         """Remove the lib_symbols section from the content to avoid parsing symbol definitions.
@@ -222,28 +227,15 @@ class SchematicParser:
         if not lib_symbols_match:
             return self.content
 
-        # Find the end of the lib_symbols section by tracking parentheses
+        # Find the end of the lib_symbols section by balancing parentheses
         start_pos = lib_symbols_match.start()
-        current_pos = start_pos
-        depth = 0
-
-        while current_pos < len(self.content):
-            char = self.content[current_pos]
-
-            if char == '(':
-                depth += 1
-            elif char == ')':
-                depth -= 1
-                if depth == 0:
-                    # Found the end of lib_symbols
-                    end_pos = current_pos + 1
-                    # Remove the lib_symbols section
-                    return self.content[:start_pos] + self.content[end_pos:]
-
-            current_pos += 1
+        end_pos = _find_expr_end(self.content, start_pos)
+        if end_pos == -1:
+            # If we didn't find the end, return the original content
+            return self.content
 
-        # If we didn't find the end, return the original content
-        return self.content
+        # Remove the lib_symbols section
+        return self.content[:start_pos] + self.content[end_pos:]
 
     def _extract_s_expressions_from_content(self, pattern: str, content: str) -> List[str]:
         """Extract all matching S-expressions from given content.
@@ -256,35 +248,19 @@ class SchematicParser:
             List of matching S-expressions
         """
         matches = []
-        positions = []
 
-        # Find all starting positions of matches
+        # Slice each balanced expression out directly; the end is located by
+        # jumping between parentheses rather than walking one character at a
+        # time and growing a string per character
         for match in re.finditer(pattern, content):
-            positions.append(match.start())
-
-        # Extract full S-expressions for each match
-        for pos in positions:
-            # Start from the matching position
-            current_pos = pos
-            depth = 0
-            s_exp = ""
-
-            # Extract the full S-expression by tracking parentheses
-            while current_pos < len(content):
-                char = content[current_pos]
-                s_exp += char
-
-                if char == '(':
-                    depth += 1
-                elif char == ')':
-                    depth -= 1
-                    if depth == 0:
-                        # Found the end of the S-expression
-                        break
-
-                current_pos += 1
-
-            matches.append(s_exp)
+            start = match.start()
+            end = _find_expr_end(content, start)
+            if end != -1:
+                matches.append(content[start:end])
+            else:
+                # Unbalanced tail: preserve the previous behavior of taking
+                # everything to the end of the content
+                matches.append(content[start:])
 
         return matches
 
@@ -349,7 +325,7 @@ class SchematicParser:
 
     def _extract_wires(self) -> None:
         """Extract wire information from schematic."""
-        print("Extracting wires")
+        logger.info("Extracting wires")
         
         # Extract all wire expressions
         wires = self._extract_s_expressions(r'\(wire\s+')
@@ -369,11 +345,11 @@ class SchematicParser:
                     }
                 })
         
-        print(f"Extracted {len(self.wires)} wires")
+        logger.info("Extracted %s wires", len(self.wires))
 
     def _extract_junctions(self) -> None:
         """Extract junction information from schematic."""
-        print("Extracting junctions")
+        logger.info("Extracting junctions")
         
         # Extract all junction expressions
         junctions = self._extract_s_expressions(r'\(junction\s+')
@@ -387,11 +363,11 @@ class SchematicParser:
                     'y': float(xy_match.group(2))
                 })
         
-        print(f"Extracted {len(self.junctions)} junctions")
+        logger.info("Extracted %s junctions", len(self.junctions))
 
     def _extract_labels(self) -> None:
         """Extract label information from schematic."""
-        print("Extracting labels")
+        logger.info("Extracting labels")
         
         # Extract local labels
         local_labels = self._extract_s_expressions(r'\(label\s+')
@@ -446,11 +422,11 @@ class SchematicParser:
                     }
                 })
         
-        print(f"Extracted {len(self.labels)} local labels, {len(self.global_labels)} global labels, and {len(self.hierarchical_labels)} hierarchical labels")
+        logger.info("Extracted %s local labels, %s global labels, and %s hierarchical labels", len(self.labels), len(self.global_labels), len(self.hierarchical_labels))
 
     def _extract_power_symbols(self) -> None:
         """Extract power symbol information from schematic."""
-        print("Extracting power symbols")
+        logger.info("Extracting power symbols")
         
         # Extract all power symbol expressions
         power_symbols = self._extract_s_expressions(r'\(symbol\s+\(lib_id\s+"power:')
@@ -470,11 +446,11 @@ class SchematicParser:
                     }
                 })
         
-        print(f"Extracted {len(self.power_symbols)} power symbols")
+        logger.info("Extracted %s power symbols", len(self.power_symbols))
 
     def _extract_no_connects(self) -> None:
         """Extract no-connect information from schematic."""
-        print("Extracting no-connects")
+        logger.info("Extracting no-connects")
 
         # Extract all no-connect expressions
         no_connects = self._extract_s_expressions(r'\(no_connect\s+')
@@ -488,11 +464,11 @@ class SchematicParser:
                     'y': float(xy_match.group(2))
                 })
 
-        print(f"Extracted {len(self.no_connects)} no-connects")
+        logger.info("Extracted %s no-connects", len(self.no_connects))
 
     def _extract_sheets(self) -> None:
         """Extract hierarchical sheet information from schematic."""
-        print("Extracting hierarchical sheets")
+        logger.info("Extracting hierarchical sheets")
 
         # Extract all sheet expressions
         sheets = self._extract_s_expressions(r'\(sheet\s+')
@@ -507,7 +483,7 @@ class SchematicParser:
                     'path': None  # Will be resolved later
                 })
 
-        print(f"Extracted {len(self.sheets)} hierarchical sheets")
+        logger.info("Extracted %s hierarchical sheets", len(self.sheets))
 
     def _parse_hierarchical_sheets(self) -> None:
         """Parse hierarchical sub-sheets and merge their data."""
@@ -518,7 +494,7 @@ class SchematicParser:
         schematic_dir = os.path.dirname(self.schematic_path)
         total_sheets = len(self.sheets)
 
-        print(f"Starting hierarchical sheet parsing: {total_sheets} sheets to process")
+        logger.info("Starting hierarchical sheet parsing: %s sheets to process", total_sheets)
 
         for idx, sheet in enumerate(self.sheets, 1):
             sheet_file = sheet['file']
@@ -526,15 +502,15 @@ class SchematicParser:
             sheet['path'] = sheet_path
 
             if not os.path.exists(sheet_path):
-                print(f"[{idx}/{total_sheets}] Warning: Sub-schematic not found: {sheet_path}")
+                logger.warning("[%s/%s] Sub-schematic not found: %s", idx, total_sheets, sheet_path)
                 continue
 
-            print(f"[{idx}/{total_sheets}] Starting parse of sub-schematic: {sheet_file}")
+            logger.info("[%s/%s] Starting parse of sub-schematic: %s", idx, total_sheets, sheet_file)
             start_time = time.time()
 
             try:
                 # Parse the sub-schematic with timeout enforcement
-                print(f"  [{idx}/{total_sheets}] Creating parser for {sheet_file}")
+                logger.info("  [%s/%s] Creating parser for %s", idx, total_sheets, sheet_file)
 
                 def parse_sheet():
                     sub_parser = SchematicParser(sheet_path, is_hierarchical=False, timeout=self.timeout)
@@ -544,14 +520,14 @@ class SchematicParser:
                 with ThreadPoolExecutor(max_workers=1) as executor:
                     future = executor.submit(parse_sheet)
                     try:
-                        print(f"  [{idx}/{total_sheets}] Calling parse() for {sheet_file} (timeout: {self.timeout}s)")
+                        logger.info("  [%s/%s] Calling parse() for %s (timeout: %ss)", idx, total_sheets, sheet_file, self.timeout)
                         sub_result = future.result(timeout=self.timeout)
 
                         parse_time = time.time() - start_time
-                        print(f"  [{idx}/{total_sheets}] Parse completed in {parse_time:.2f}s")
+                        logger.info("  [%s/%s] Parse completed in %.2fs", idx, total_sheets, parse_time)
 
                         # Merge components from sub-schematic
-                        print(f"  [{idx}/{total_sheets}] Merging components from {sheet_file}")
+                        logger.info("  [%s/%s] Merging components from %s", idx, total_sheets, sheet_file)
                         merged_count = 0
                         for ref, component in sub_result.get('components', {}).items():
                             if ref not in self.component_info:
@@ -560,12 +536,12 @@ class SchematicParser:
                                 component['sheet'] = sheet_file
                                 merged_count += 1
                             else:
-                                print(f"  Warning: Duplicate component reference {ref} found in {sheet_file}")
+                                logger.warning("  Duplicate component reference %s found in %s", ref, sheet_file)
 
-                        print(f"  [{idx}/{total_sheets}] Merged {merged_count} components from {sheet_file}")
+                        logger.info("  [%s/%s] Merged %s components from %s", idx, total_sheets, merged_count, sheet_file)
 
                         # Merge nets from sub-schematic
-                        print(f"  [{idx}/{total_sheets}] Merging nets from {sheet_file}")
+                        logger.info("  [%s/%s] Merging nets from %s", idx, total_sheets, sheet_file)
                         merged_nets = 0
                         for net_name, pins in sub_result.get('nets', {}).items():
                             if net_name in self.nets:
@@ -576,28 +552,28 @@ class SchematicParser:
                                 merged_nets += 1
 
                         total_time = time.time() - start_time
-                        print(f"  [{idx}/{total_sheets}] Completed {sheet_file} in {total_time:.2f}s: {merged_count} components, {merged_nets} new nets")
+                        logger.info("  [%s/%s] Completed %s in %.2fs: %s components, %s new nets", idx, total_sheets, sheet_file, total_time, merged_count, merged_nets)
 
                     except FutureTimeoutError:
                         error_time = time.time() - start_time
-                        print(f"  [{idx}/{total_sheets}] TIMEOUT: Parsing {sheet_file} exceeded {self.timeout}s limit (stopped at {error_time:.2f}s)")
+                        logger.warning("  [%s/%s] TIMEOUT: Parsing %s exceeded %ss limit (stopped at %.2fs)", idx, total_sheets, sheet_file, self.timeout, error_time)
                         raise TimeoutError(f"Schematic parsing timed out after {self.timeout}s for file: {sheet_file}")
 
             except TimeoutError as e:
                 error_time = time.time() - start_time
-                print(f"  [{idx}/{total_sheets}] Timeout error parsing {sheet_file} after {error_time:.2f}s")
+                logger.warning("  [%s/%s] Timeout error parsing %s after %.2fs", idx, total_sheets, sheet_file, error_time)
                 raise  # Re-raise to propagate timeout to caller
             except Exception as e:
                 error_time = time.time() - start_time
-                print(f"  [{idx}/{total_sheets}] Error parsing sub-schematic {sheet_file} after {error_time:.2f}s: {str(e)}")
+                logger.error("  [%s/%s] Error parsing sub-schematic %s after %.2fs: %s", idx, total_sheets, sheet_file, error_time, str(e))
                 import traceback
                 traceback.print_exc()
 
-        print(f"Completed hierarchical sheet parsing: processed {total_sheets} sheets")
+        logger.info("Completed hierarchical sheet parsing: processed %s sheets", total_sheets)
 
     def _build_netlist(self) -> None:
         """Build the netlist from extracted components and connections."""
-        print("Building netlist from schematic data")
+        logger.info("Building netlist from schematic data")
         
         # TODO: Implement netlist building algorithm
         # This is a complex task that involves:
@@ -625,8 +601,8 @@ class SchematicParser:
         # and detect connected pins
         
         # For demonstration, we'll add a placeholder note
-        print("Note: Full netlist building requires complex connectivity tracing")
-        print(f"Found {len(self.nets)} potential nets from labels and power symbols")
+        logger.info("Note: Full netlist building requires complex connectivity tracing")
+        logger.info("Found %s potential nets from labels and power symbols", len(self.nets))
 
 
 def extract_netlist(schematic_path: str, timeout: float = 60.0, is_hierarchical: bool = False) -> Dict[str, Any]:
@@ -651,12 +627,12 @@ def extract_netlist(schematic_path: str, timeout: float = 60.0, is_hierarchical:
         with ThreadPoolExecutor(max_workers=1) as executor:
             future = executor.submit(parse_with_timeout)
             try:
-                print(f"Starting schematic parsing with {timeout}s timeout...")
+                logger.info("Starting schematic parsing with %ss timeout...", timeout)
                 result = future.result(timeout=timeout)
-                print(f"Schematic parsing completed successfully")
+                logger.info("Schematic parsing completed successfully")
                 return result
             except FutureTimeoutError:
-                print(f"TIMEOUT: Schematic parsing exceeded {timeout}s limit")
+                logger.warning("TIMEOUT: Schematic parsing exceeded %ss limit", timeout)
                 return {
                     "error": f"Timeout: Schematic parsing exceeded {timeout}s limit",
                     "timeout": True,
@@ -666,7 +642,7 @@ def extract_netlist(schematic_path: str, timeout: float = 60.0, is_hierarchical:
                     "net_count": 0
                 }
     except TimeoutError as e:
-        print(f"Timeout extracting netlist: {str(e)}")
+        logger.warning("Timeout extracting netlist: %s", str(e))
         return {
             "error": f"Timeout: {str(e)}",
             "timeout": True,
@@ -676,7 +652,7 @@ def extract_netlist(schematic_path: str, timeout: float = 60.0, is_hierarchical:
             "net_count": 0
         }
     except Exception as e:
-        print(f"Error extracting netlist: {str(e)}")
+        logger.error("Error extracting netlist: %s", str(e))
         return {
             "error": str(e),
             "timeout": False,
@@ -4,10 +4,47 @@ KiCAD PCB Netlist Parser
 Extracts pin-to-net connectivity from .kicad_pcb files.
 The PCB file contains the complete netlist that was imported from the schematic.
 """
+import mmap
 import re
-from typing import Dict, List, Tuple, Set
+import sys
+from typing import Dict, List, Tuple, Set, Union
 from pathlib import Path
 
+# Bytes-like content the parser scans: an mmap'd file or a plain bytes slice
+_Content = Union[bytes, mmap.mmap]
+
+
+def _find_expr_end(content: _Content, start: int) -> int:
+    """
+    Find the end of the balanced S-expression starting at `start`.
+
+    Jumps between parentheses with .find (a C-level scan) instead of
+    visiting every byte from Python.
+
+    Args:
+        content: Bytes-like data containing the S-expression
+        start: Index of the opening parenthesis
+
+    Returns:
+        Index one past the closing parenthesis, or -1 if unbalanced
+    """
+    depth = 0
+    pos = start
+    find = content.find
+    while True:
+        close_pos = find(b')', pos)
+        if close_pos == -1:
+            return -1
+        open_pos = find(b'(', pos, close_pos)
+        if open_pos != -1:
+            depth += 1
+            pos = open_pos + 1
+        else:
+            depth -= 1
+            pos = close_pos + 1
+            if depth == 0:
+                return pos
+
 
 class PCBNetlistParser:
     """Parser for extracting netlist from KiCAD PCB files (.kicad_pcb)"""
@@ -20,7 +57,7 @@ class PCBNetlistParser:
             pcb_file_path: Path to the .kicad_pcb file
         """
         self.pcb_file_path = Path(pcb_file_path)
-        self.content = ""
+        self.content: _Content = b""
 
         # Parsed data
         self.net_names: Dict[int, str] = {}  # net_id -> net_name
@@ -29,12 +66,21 @@ class PCBNetlistParser:
         self._load_pcb_file()
 
     def _load_pcb_file(self) -> None:
-        """Load the PCB file content."""
+        """Map the PCB file into memory.
+
+        mmap lets the regex scans run over the kernel's page cache without
+        materializing a second decoded copy of the file; atoms are decoded
+        lazily as they are extracted.
+        """
         if not self.pcb_file_path.exists():
             raise FileNotFoundError(f"PCB file not found: {self.pcb_file_path}")
 
-        with open(self.pcb_file_path, 'r', encoding='utf-8') as f:
-            self.content = f.read()
+        with open(self.pcb_file_path, 'rb') as f:
+            try:
+                self.content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                self.content = f.read()
 
     def parse(self) -> Dict[str, Dict[str, str]]:
         """
@@ -50,11 +96,17 @@ class PCBNetlistParser:
                 ...
             }
         """
-        # Extract net definitions
-        self._extract_net_definitions()
+        try:
+            # Extract net definitions
+            self._extract_net_definitions()
 
-        # Extract footprints and pad connectivity
-        self._extract_footprints()
+            # Extract footprints and pad connectivity
+            self._extract_footprints()
+        finally:
+            # Release the mapping; all extracted atoms are decoded copies
+            if isinstance(self.content, mmap.mmap):
+                self.content.close()
+                self.content = b""
 
         return self.component_pads
 
@@ -65,11 +117,12 @@ class PCBNetlistParser:
         Format: (net 371 "VCC_3.3")
         """
         # Pattern matches: (net <number> "<name>")
-        net_pattern = r'\(net\s+(\d+)\s+"([^"]*)"\)'
+        net_pattern = rb'\(net\s+(\d+)\s+"([^"]*)"\)'
 
         for match in re.finditer(net_pattern, self.content):
             net_id = int(match.group(1))
-            net_name = match.group(2)
+            # Interned so every pad on this net shares one string object
+            net_name = sys.intern(match.group(2).decode('utf-8'))
             self.net_names[net_id] = net_name
 
     def _extract_footprints(self) -> None:
@@ -84,43 +137,36 @@ class PCBNetlistParser:
             )
         """
         # Find all footprint blocks
-        footprint_blocks = self._extract_s_expressions(r'\(footprint\s+"[^"]*"')
+        footprint_blocks = self._extract_s_expressions(rb'\(footprint\s+"[^"]*"')
 
         for footprint_block in footprint_blocks:
             # Extract reference designator
-            ref_match = re.search(r'\(property\s+"Reference"\s+"([^"]+)"', footprint_block)
+            ref_match = re.search(rb'\(property\s+"Reference"\s+"([^"]+)"', footprint_block)
             if not ref_match:
                 continue
 
-            refdes = ref_match.group(1)
+            refdes = sys.intern(ref_match.group(1).decode('utf-8'))
 
             # Extract all pads and their nets using proper S-expression parsing
             pad_nets = {}
 
             # Find all pad S-expressions within this footprint
-            for pad_match in re.finditer(r'\(pad\s+"([^"]+)"', footprint_block):
-                pad_num = pad_match.group(1)
+            for pad_match in re.finditer(rb'\(pad\s+"([^"]+)"', footprint_block):
+                pad_num = sys.intern(pad_match.group(1).decode('utf-8'))
                 pad_start = pad_match.start()
 
                 # Extract the complete pad S-expression using balanced parentheses
-                depth = 0
-                pad_end = pad_start
-                for i in range(pad_start, len(footprint_block)):
-                    if footprint_block[i] == '(':
-                        depth += 1
-                    elif footprint_block[i] == ')':
-                        depth -= 1
-                        if depth == 0:
-                            pad_end = i + 1
-                            break
+                pad_end = _find_expr_end(footprint_block, pad_start)
+                if pad_end == -1:
+                    continue
 
                 pad_block = footprint_block[pad_start:pad_end]
 
                 # Extract net from this specific pad block
-                net_match = re.search(r'\(net\s+(\d+)\s+"([^"]*)"\)', pad_block)
+                net_match = re.search(rb'\(net\s+(\d+)\s+"([^"]*)"\)', pad_block)
                 if net_match:
                     net_id = int(net_match.group(1))
-                    net_name = net_match.group(2)
+                    net_name = sys.intern(net_match.group(2).decode('utf-8'))
 
                     # For pads with same number (multiple instances), keep first one
                     # This handles PowerPAK footprints with multiple physical pads per pin
@@ -130,38 +176,23 @@ class PCBNetlistParser:
             if pad_nets:
                 self.component_pads[refdes] = pad_nets
 
-    def _extract_s_expressions(self, pattern: str) -> List[str]:
+    def _extract_s_expressions(self, pattern: bytes) -> List[bytes]:
         """
         Extract all matching S-expressions from the PCB content.
 
         Args:
-            pattern: Regex pattern to match the start of S-expressions
+            pattern: Bytes regex pattern to match the start of S-expressions
 
         Returns:
             List of matching S-expressions (balanced parentheses)
         """
         matches = []
-        positions = []
-
-        # Find all starting positions
-        for match in re.finditer(pattern, self.content):
-            positions.append(match.start())
 
         # Extract balanced S-expressions
-        for start_pos in positions:
-            depth = 0
-            end_pos = start_pos
-
-            for i in range(start_pos, len(self.content)):
-                if self.content[i] == '(':
-                    depth += 1
-                elif self.content[i] == ')':
-                    depth -= 1
-                    if depth == 0:
-                        end_pos = i + 1
-                        break
-
-            if end_pos > start_pos:
+        for match in re.finditer(pattern, self.content):
+            start_pos = match.start()
+            end_pos = _find_expr_end(self.content, start_pos)
+            if end_pos != -1:
                 matches.append(self.content[start_pos:end_pos])
 
         return matches